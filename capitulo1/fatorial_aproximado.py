@@ -0,0 +1,144 @@
+import math
+from decimal import Decimal, localcontext
+
+
+# Coeficientes da série de Stirling para ln(n!):
+# ln(n!) ≈ n·ln(n) - n + ln(2πn)/2 + 1/(12n) - 1/(360n³) + 1/(1260n⁵) - 1/(1680n⁷)
+_CORRECOES_STIRLING = ((1, 12, 1), (-1, 360, 3), (1, 1260, 5), (-1, 1680, 7))
+
+
+def _validar(n):
+    """Valida a entrada das funções de fatorial."""
+    if n < 0:
+        raise ValueError("Fatorial não definido para números negativos")
+
+
+def log_fatorial(n):
+    """
+    Calcula ln(n!) em O(1) usando a função log-gama: ln(n!) = lgamma(n + 1).
+    O resultado tem a precisão de um float (cerca de 15 dígitos).
+    """
+    _validar(n)
+    return math.lgamma(n + 1)
+
+
+def log_fatorial_stirling(n, termos=2):
+    """
+    Aproxima ln(n!) pela série de Stirling com a quantidade de termos de
+    correção indicada (0 a 3).
+    
+    Retorna uma tupla (aproximacao, limite_erro). Como a série alterna
+    de sinal, o erro de truncamento é menor que o primeiro termo
+    desprezado. O arredondamento do float acrescenta um erro relativo
+    da ordem de 1e-16.
+    """
+    _validar(n)
+    if not 0 <= termos < len(_CORRECOES_STIRLING):
+        raise ValueError(f"termos deve estar entre 0 e {len(_CORRECOES_STIRLING) - 1}")
+    
+    # 0! = 1! = 1, portanto ln(n!) = 0 exatamente
+    if n < 2:
+        return 0.0, 0.0
+    
+    aproximacao = n * math.log(n) - n + math.log(2 * math.pi * n) / 2
+    for sinal, divisor, expoente in _CORRECOES_STIRLING[:termos]:
+        aproximacao += sinal / (divisor * n ** expoente)
+    
+    # O primeiro termo desprezado limita o erro
+    _, divisor, expoente = _CORRECOES_STIRLING[termos]
+    limite_erro = 1 / (divisor * n ** expoente)
+    
+    return aproximacao, limite_erro
+
+
+def digitos_fatorial(n):
+    """
+    Retorna a quantidade exata de dígitos decimais de n! sem calculá-lo:
+    digitos = ⌊log10(n!)⌋ + 1.
+    
+    Usa a série de Stirling com aritmética decimal de alta precisão,
+    para que o arredondamento de floats não afete a parte inteira.
+    """
+    _validar(n)
+    
+    # Valores pequenos: calcula diretamente
+    if n < 20:
+        return len(str(math.factorial(n)))
+    
+    with localcontext() as contexto:
+        # Precisão suficiente para a parte inteira e mais 30 casas decimais
+        contexto.prec = len(str(n)) * 2 + 30
+        
+        m = Decimal(n)
+        pi = Decimal("3.14159265358979323846264338327950288419716939937510")
+        log_natural = m * m.ln() - m + (2 * pi * m).ln() / 2
+        for sinal, divisor, expoente in _CORRECOES_STIRLING:
+            log_natural += Decimal(sinal) / (divisor * m ** expoente)
+        
+        log_decimal = log_natural / Decimal(10).ln()
+        return int(log_decimal) + 1
+
+
+def zeros_finais_fatorial(n):
+    """
+    Conta os zeros no final de n! em O(log n) (fórmula de Legendre).
+    Cada zero vem de um fator 10 = 2 × 5, e há sempre mais fatores 2
+    que fatores 5, então basta contar os fatores 5:
+        ⌊n/5⌋ + ⌊n/25⌋ + ⌊n/125⌋ + ...
+    """
+    _validar(n)
+    
+    zeros = 0
+    potencia = 5
+    while potencia <= n:
+        zeros += n // potencia
+        potencia *= 5
+    return zeros
+
+
+def log_razao_fatoriais(a, b, limite_soma=1000):
+    """
+    Calcula ln(a! / b!) sem calcular os fatoriais.
+    
+    Se a e b são próximos, a diferença lgamma(a+1) - lgamma(b+1) perderia
+    precisão (subtração de dois números grandes e quase iguais); nesse
+    caso soma diretamente ln(b+1) + ... + ln(a).
+    """
+    _validar(a)
+    _validar(b)
+    
+    # ln(a!/b!) = -ln(b!/a!)
+    if a < b:
+        return -log_razao_fatoriais(b, a, limite_soma)
+    
+    if a - b <= limite_soma:
+        return math.fsum(math.log(i) for i in range(b + 1, a + 1))
+    
+    return math.lgamma(a + 1) - math.lgamma(b + 1)
+
+
+def main():
+    """
+    Demonstra as funções aproximadas e analíticas de fatorial.
+    """
+    n = 10 ** 6
+    
+    print(f"ln({n}!) via lgamma:   {log_fatorial(n):.6f}")
+    aproximacao, erro = log_fatorial_stirling(n)
+    print(f"ln({n}!) via Stirling: {aproximacao:.6f} (erro < {erro:.1e})")
+    print(f"{n}! possui {digitos_fatorial(n)} dígitos")
+    print(f"{n}! termina com {zeros_finais_fatorial(n)} zeros")
+    print(f"ln(({n}+10)! / {n}!) = {log_razao_fatoriais(n + 10, n):.6f}")
+    
+    # Conferência com o valor exato para um n menor
+    n = 1000
+    exato = math.factorial(n)
+    texto = str(exato)
+    print(f"\nConferência com n = {n}:")
+    print(f"Dígitos: {digitos_fatorial(n)} (exato: {len(texto)})")
+    print(f"Zeros finais: {zeros_finais_fatorial(n)} (exato: {len(texto) - len(texto.rstrip('0'))})")
+
+
+# Ponto de entrada do programa
+if __name__ == "__main__":
+    main()
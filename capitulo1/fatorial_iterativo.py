@@ -16,5 +16,247 @@ def fatorial_iterativo(n):
     
     return resultado
 
+
+def _produto_intervalo(inicio, fim):
+    """
+    Calcula o produto inicio × (inicio+1) × ... × fim usando uma árvore
+    de produtos: divide o intervalo ao meio e multiplica as duas metades.
+    Assim os fatores de cada multiplicação têm tamanhos parecidos.
+    """
+    # Intervalo vazio: elemento neutro da multiplicação
+    if inicio > fim:
+        return 1
+    
+    # Intervalos pequenos: o laço simples é mais barato que dividir
+    if fim - inicio < 8:
+        resultado = inicio
+        for i in range(inicio + 1, fim + 1):
+            resultado *= i
+        return resultado
+    
+    # Divide o intervalo ao meio e multiplica os dois produtos parciais
+    meio = (inicio + fim) // 2
+    return _produto_intervalo(inicio, meio) * _produto_intervalo(meio + 1, fim)
+
+
+def fatorial_arvore_produtos(n):
+    """
+    Calcula n! usando uma árvore de produtos (binary splitting).
+    
+    O laço de fatorial_iterativo multiplica um número enorme por um
+    número pequeno a cada passo. Aqui o intervalo 1..n é dividido
+    recursivamente ao meio, de modo que as multiplicações combinam
+    números de tamanhos parecidos, aproveitando a multiplicação
+    rápida de inteiros grandes do Python (Karatsuba).
+    
+    A profundidade da recursão é apenas log2(n).
+    """
+    # Validação de entrada
+    if n < 0:
+        raise ValueError("Fatorial não definido para números negativos")
+    
+    return _produto_intervalo(1, n)
+
+
+def _multiplicar_em_arvore(fatores):
+    """
+    Multiplica uma lista de números combinando-os dois a dois
+    (árvore balanceada), para que os operandos tenham tamanhos parecidos.
+    """
+    if not fatores:
+        return 1
+    
+    while len(fatores) > 1:
+        proximos = []
+        for i in range(0, len(fatores) - 1, 2):
+            proximos.append(fatores[i] * fatores[i + 1])
+        
+        # Quantidade ímpar: o último fator sobe sem multiplicar
+        if len(fatores) % 2 == 1:
+            proximos.append(fatores[-1])
+        fatores = proximos
+    
+    return fatores[0]
+
+
+def fatorial_paralelo(n, processos=None, n_minimo=20000):
+    """
+    Calcula n! dividindo o intervalo 1..n em blocos cujos produtos são
+    calculados em paralelo por um ProcessPoolExecutor. Os produtos
+    parciais são então combinados com uma árvore balanceada.
+    
+    Parâmetros:
+        n: número cujo fatorial será calculado
+        processos: quantidade de processos (None = número de CPUs)
+        n_minimo: abaixo desse valor o custo de criar processos não
+                  compensa e o cálculo é feito com a árvore de produtos
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    
+    # Validação de entrada
+    if n < 0:
+        raise ValueError("Fatorial não definido para números negativos")
+    if processos is None:
+        processos = os.cpu_count() or 1
+    if processos < 1:
+        raise ValueError("A quantidade de processos deve ser positiva")
+    
+    # 0! e 1! não têm o que dividir em blocos
+    if processos == 1 or n < 2 or n < n_minimo:
+        return fatorial_arvore_produtos(n)
+    
+    # Divide 1..n em blocos de tamanhos iguais (alguns blocos por processo
+    # para equilibrar a carga entre eles)
+    quantidade_blocos = processos * 4
+    tamanho_bloco = -(-n // quantidade_blocos)
+    inicios = list(range(1, n + 1, tamanho_bloco))
+    fins = [min(inicio + tamanho_bloco - 1, n) for inicio in inicios]
+    
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        parciais = list(executor.map(_produto_intervalo, inicios, fins))
+    
+    return _multiplicar_em_arvore(parciais)
+
+
+def gerar_fatoriais(limite=None, modulo=None):
+    """
+    Gera a sequência 0!, 1!, 2!, ..., limite! de forma incremental:
+    cada termo é obtido do anterior com uma única multiplicação.
+    Se limite for None a sequência é infinita.
+    Se modulo for informado, os termos são gerados módulo esse valor.
+    """
+    # Validação de entrada
+    if limite is not None and limite < 0:
+        raise ValueError("Fatorial não definido para números negativos")
+    if modulo is not None and modulo <= 0:
+        raise ValueError("Módulo deve ser um inteiro positivo")
+    
+    # A validação fica fora do gerador para que o erro apareça já na chamada
+    return _gerar_fatoriais(limite, modulo)
+
+
+def _gerar_fatoriais(limite, modulo):
+    """Gerador usado por gerar_fatoriais, com os parâmetros já validados."""
+    # 0! = 1 (reduzido pelo módulo, caso exista)
+    resultado = 1 if modulo is None else 1 % modulo
+    yield resultado
+    
+    i = 1
+    while limite is None or i <= limite:
+        # n! = n × (n-1)!
+        resultado *= i
+        if modulo is not None:
+            resultado %= modulo
+        yield resultado
+        i += 1
+
+
+class TabelaCombinacoes:
+    """
+    Pré-calcula fatoriais e fatoriais inversos módulo p para responder
+    C(n, k) mod p em O(1), para qualquer n até o limite informado.
+    
+    O módulo p normalmente é um primo maior que o limite
+    (por exemplo 10**9 + 7), para que todos os fatoriais sejam inversíveis.
+    """
+
+    def __init__(self, limite, p):
+        # Validação de entrada
+        if limite < 0:
+            raise ValueError("Fatorial não definido para números negativos")
+        if p <= limite:
+            raise ValueError("O módulo deve ser maior que o limite")
+        
+        self.limite = limite
+        self.p = p
+        
+        # fatoriais[i] = i! mod p, obtidos em uma única passada
+        self.fatoriais = list(gerar_fatoriais(limite, p))
+        
+        # Inverte apenas o último fatorial e volta usando
+        # (i-1)!^-1 = i!^-1 × i
+        self.inversos = [0] * (limite + 1)
+        self.inversos[limite] = pow(self.fatoriais[limite], -1, p)
+        for i in range(limite, 0, -1):
+            self.inversos[i - 1] = self.inversos[i] * i % p
+
+    def combinacao(self, n, k):
+        """Retorna C(n, k) mod p = n! / (k! × (n-k)!) mod p."""
+        if n < 0 or n > self.limite:
+            raise ValueError("n fora do intervalo pré-calculado")
+        if k < 0 or k > n:
+            return 0
+        
+        return (self.fatoriais[n] * self.inversos[k] % self.p
+                * self.inversos[n - k] % self.p)
+
+
+def comparar_desempenho(valores_n=(1000, 5000, 20000, 50000)):
+    """
+    Compara o tempo do laço iterativo com o da árvore de produtos
+    para diferentes valores de n.
+    """
+    import time
+    
+    print(f"{'n':>8} | {'laço (s)':>10} | {'árvore (s)':>10} | {'ganho':>7}")
+    print("-" * 45)
+    
+    for n in valores_n:
+        inicio = time.perf_counter()
+        esperado = fatorial_iterativo(n)
+        tempo_laco = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter()
+        obtido = fatorial_arvore_produtos(n)
+        tempo_arvore = time.perf_counter() - inicio
+        
+        # Os dois métodos precisam produzir exatamente o mesmo número
+        assert esperado == obtido
+        
+        ganho = tempo_laco / tempo_arvore if tempo_arvore > 0 else float("inf")
+        print(f"{n:>8} | {tempo_laco:>10.4f} | {tempo_arvore:>10.4f} | {ganho:>6.1f}x")
+
+
+def comparar_paralelismo(n=200000, lista_processos=(1, 2, 4, 8)):
+    """
+    Mede o tempo de fatorial_paralelo para diferentes quantidades de
+    processos e mostra o ganho em relação a um único processo.
+    """
+    import time
+    
+    print(f"n = {n}")
+    print(f"{'processos':>9} | {'tempo (s)':>9} | {'ganho':>6}")
+    print("-" * 32)
+    
+    esperado = None
+    tempo_base = None
+    for processos in lista_processos:
+        inicio = time.perf_counter()
+        resultado = fatorial_paralelo(n, processos)
+        tempo = time.perf_counter() - inicio
+        
+        # Todas as configurações precisam produzir o mesmo número
+        if esperado is None:
+            esperado = resultado
+            tempo_base = tempo
+        assert resultado == esperado
+        
+        print(f"{processos:>9} | {tempo:>9.3f} | {tempo_base / tempo:>5.2f}x")
+
+
 # Exemplo de uso
-print("5! =", fatorial_iterativo(5))  # Saída: 5! = 120
\ No newline at end of file
+if __name__ == "__main__":
+    print("5! =", fatorial_iterativo(5))  # Saída: 5! = 120
+    print("5! =", fatorial_arvore_produtos(5))  # Saída: 5! = 120
+    
+    print("Fatoriais de 0 a 10:", list(gerar_fatoriais(10)))
+    
+    tabela = TabelaCombinacoes(1000, 10 ** 9 + 7)
+    print("C(1000, 500) mod 10^9+7 =", tabela.combinacao(1000, 500))
+    
+    print("\nComparação de desempenho:")
+    comparar_desempenho()
+
+    print("\nEscalabilidade do fatorial paralelo:")
+    comparar_paralelismo()
@@ -14,5 +14,76 @@ def fatorial_recursivo(n):
     # Passo recursivo: n! = n × (n-1)!
     return n * fatorial_recursivo(n - 1)
 
+def fatorial_pilha(n):
+    """
+    Calcula n! simulando a recursão com uma pilha explícita.
+    Empilha n, n-1, ..., 2 (as chamadas pendentes) e depois desempilha
+    multiplicando, na mesma ordem em que a recursão retornaria.
+    Não sofre com o limite de recursão do Python.
+    """
+    # Validação de entrada
+    if n < 0:
+        raise ValueError("Fatorial não definido para números negativos")
+    
+    # Fase de "ida": empilha as chamadas até o caso base
+    pilha = []
+    while n > 1:
+        pilha.append(n)
+        n -= 1
+    
+    # Caso base: 0! = 1! = 1
+    resultado = 1
+    
+    # Fase de "volta": desempilha multiplicando n × (n-1)!
+    while pilha:
+        resultado = pilha.pop() * resultado
+    
+    return resultado
+
+
+def medir(funcao, *args):
+    """
+    Executa funcao(*args) e retorna (resultado, tempo em segundos,
+    pico de memória alocada em bytes).
+    """
+    import time
+    import tracemalloc
+    
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    tempo = time.perf_counter() - inicio
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    return resultado, tempo, pico
+
+
+def comparar_recursivo_pilha(n=900, repeticoes=200):
+    """
+    Compara a versão recursiva com a versão de pilha explícita:
+    custo médio por chamada e pico de memória.
+    """
+    import time
+    
+    for nome, funcao in (("recursivo", fatorial_recursivo),
+                         ("pilha", fatorial_pilha)):
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            funcao(n)
+        tempo_medio = (time.perf_counter() - inicio) / repeticoes
+        
+        _, _, pico = medir(funcao, n)
+        print(f"{nome:>10}: {tempo_medio * 1e6:10.1f} µs/chamada, pico {pico / 1024:8.1f} KiB")
+
+
 # Exemplo de uso
-print("5! =", fatorial_recursivo(5))  # Saída: 5! = 120
\ No newline at end of file
+if __name__ == "__main__":
+    print("5! =", fatorial_recursivo(5))  # Saída: 5! = 120
+    print("5! =", fatorial_pilha(5))  # Saída: 5! = 120
+    
+    # A versão com pilha funciona bem além do limite de recursão
+    print("5000! possui", fatorial_pilha(5000).bit_length(), "bits")
+    
+    print("\nComparação (n = 900):")
+    comparar_recursivo_pilha()
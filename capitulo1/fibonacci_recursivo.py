@@ -16,5 +16,131 @@ def fibonacci_recursivo(n):
     # Passo recursivo: F(n) = F(n-1) + F(n-2)
     return fibonacci_recursivo(n - 1) + fibonacci_recursivo(n - 2)
 
+def gerar_fibonacci(limite=None, modulo=None):
+    """
+    Gera os termos F(1), F(2), ..., F(limite) da sequência de Fibonacci
+    de forma incremental, com uma soma por termo.
+    Segue a convenção do livro: F(1) = 0, F(2) = 1.
+    Se limite for None a sequência é infinita.
+    Se modulo for informado, os termos são gerados módulo esse valor.
+    """
+    # Validação de entrada
+    if limite is not None and limite < 0:
+        raise ValueError("Fibonacci não definido para números negativos")
+    if modulo is not None and modulo <= 0:
+        raise ValueError("Módulo deve ser um inteiro positivo")
+    
+    # A validação fica fora do gerador para que o erro apareça já na chamada
+    return _gerar_fibonacci(limite, modulo)
+
+
+def _gerar_fibonacci(limite, modulo):
+    """Gerador usado por gerar_fibonacci, com os parâmetros já validados."""
+    anterior, atual = 0, 1
+    if modulo is not None:
+        atual %= modulo
+    
+    n = 1
+    while limite is None or n <= limite:
+        yield anterior
+        
+        # Avança um termo: F(n+1) = F(n) + F(n-1)
+        anterior, atual = atual, anterior + atual
+        if modulo is not None:
+            atual %= modulo
+        n += 1
+
+
+_cache_pisano = {}
+
+
+def periodo_pisano(m):
+    """
+    Calcula o período de Pisano π(m): o comprimento do ciclo da
+    sequência de Fibonacci módulo m.
+    Exemplo: módulo 3 a sequência é 0, 1, 1, 2, 0, 2, 2, 1, (0, 1, ...)
+    então π(3) = 8.
+    """
+    # Validação de entrada
+    if m <= 0:
+        raise ValueError("Módulo deve ser um inteiro positivo")
+    
+    if m == 1:
+        return 1
+    
+    # Percorre a sequência até o par inicial (0, 1) reaparecer.
+    # O período nunca ultrapassa 6m.
+    anterior, atual = 0, 1
+    for i in range(1, 6 * m + 1):
+        anterior, atual = atual, (anterior + atual) % m
+        if anterior == 0 and atual == 1:
+            return i
+
+
+def _dobrar(k, modulo=None):
+    """
+    Retorna o par (G(k), G(k+1)) da sequência clássica G(0)=0, G(1)=1
+    usando as fórmulas de duplicação (fast doubling):
+        G(2k)   = G(k) × (2 × G(k+1) - G(k))
+        G(2k+1) = G(k)² + G(k+1)²
+    Processa os bits de k do mais significativo ao menos significativo.
+    """
+    a, b = 0, 1  # G(0), G(1)
+    
+    for bit in bin(k)[2:]:
+        # Dobra o índice: (G(j), G(j+1)) -> (G(2j), G(2j+1))
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if modulo is not None:
+            c %= modulo
+            d %= modulo
+        
+        # Bit 1: avança mais uma posição -> (G(2j+1), G(2j+2))
+        if bit == "1":
+            a, b = d, c + d
+            if modulo is not None:
+                b %= modulo
+        else:
+            a, b = c, d
+    
+    return a, b
+
+
+def fibonacci_rapido(n, modulo=None, limite_pisano=10000):
+    """
+    Calcula o n-ésimo termo da sequência de Fibonacci em O(log n)
+    multiplicações usando fast doubling.
+    Mantém a convenção de fibonacci_recursivo: F(1) = 0, F(2) = 1.
+    
+    Se modulo for informado, retorna F(n) mod modulo. Para módulos até
+    limite_pisano o índice é antes reduzido pelo período de Pisano
+    (calculado uma única vez e guardado em cache).
+    """
+    # Validação de entrada
+    if n <= 0:
+        raise ValueError("Fibonacci não definido para números negativos")
+    if modulo is not None and modulo <= 0:
+        raise ValueError("Módulo deve ser um inteiro positivo")
+    
+    # F(n) na convenção do livro corresponde a G(n-1) na convenção clássica
+    k = n - 1
+    
+    if modulo is not None and modulo <= limite_pisano:
+        if modulo not in _cache_pisano:
+            _cache_pisano[modulo] = periodo_pisano(modulo)
+        k %= _cache_pisano[modulo]
+    
+    resultado = _dobrar(k, modulo)[0]
+    if modulo is not None:
+        resultado %= modulo
+    return resultado
+
+
 # Exemplo de uso
-print("F(5) =", fibonacci_recursivo(5))
\ No newline at end of file
+if __name__ == "__main__":
+    print("F(5) =", fibonacci_recursivo(5))
+    print("F(5) =", fibonacci_rapido(5))
+    print("F(100) =", fibonacci_rapido(100))
+    print("F(1) a F(10):", list(gerar_fibonacci(10)))
+    print("F(10^6) possui", fibonacci_rapido(10 ** 6).bit_length(), "bits")
+    print("F(10^18) mod 1000 =", fibonacci_rapido(10 ** 18, modulo=1000))
@@ -0,0 +1,193 @@
+from collections import OrderedDict
+import functools
+import sys
+import threading
+
+
+class CacheMemoizacao:
+    """
+    Cache limitado para memoização com política LRU
+    (Least Recently Used: remove o item usado há mais tempo).
+    
+    Atributos:
+        max_itens (int): quantidade máxima de resultados guardados (None = sem limite)
+        max_bytes (int): tamanho máximo aproximado, em bytes, dos valores
+                         guardados, medido com sys.getsizeof (None = sem limite)
+    """
+
+    def __init__(self, max_itens=128, max_bytes=None):
+        # Validação de entrada
+        if max_itens is not None and max_itens <= 0:
+            raise ValueError("max_itens deve ser positivo")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes deve ser positivo")
+        
+        self.max_itens = max_itens
+        self.max_bytes = max_bytes
+        
+        # Chave -> (valor, tamanho em bytes); a ordem do dicionário
+        # registra o uso: o primeiro item é o menos usado recentemente
+        self._itens = OrderedDict()
+        self._bytes = 0
+        self._trava = threading.Lock()
+        
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    def obter(self, chave):
+        """
+        Procura uma chave no cache.
+        Retorna uma tupla (achou, valor).
+        """
+        with self._trava:
+            if chave in self._itens:
+                # Marca o item como usado mais recentemente
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return True, self._itens[chave][0]
+            
+            self.falhas += 1
+            return False, None
+
+    def guardar(self, chave, valor):
+        """Guarda um resultado, removendo os itens menos usados se preciso."""
+        tamanho = sys.getsizeof(valor)
+        
+        with self._trava:
+            # Substitui um valor antigo da mesma chave
+            if chave in self._itens:
+                self._bytes -= self._itens.pop(chave)[1]
+            
+            # Um valor maior que o próprio limite nunca é guardado
+            if self.max_bytes is not None and tamanho > self.max_bytes:
+                return
+            
+            self._itens[chave] = (valor, tamanho)
+            self._bytes += tamanho
+            
+            # Remove os itens menos usados até respeitar os limites
+            while ((self.max_itens is not None and len(self._itens) > self.max_itens)
+                   or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+                _, (_, tamanho_removido) = self._itens.popitem(last=False)
+                self._bytes -= tamanho_removido
+                self.remocoes += 1
+
+    def invalidar(self, chave):
+        """Remove uma chave do cache. Retorna True se ela existia."""
+        with self._trava:
+            if chave not in self._itens:
+                return False
+            self._bytes -= self._itens.pop(chave)[1]
+            return True
+
+    def limpar(self):
+        """Remove todos os itens do cache (as estatísticas são mantidas)."""
+        with self._trava:
+            self._itens.clear()
+            self._bytes = 0
+
+    def zerar_estatisticas(self):
+        """Zera os contadores de acertos, falhas e remoções."""
+        with self._trava:
+            self.acertos = 0
+            self.falhas = 0
+            self.remocoes = 0
+
+    def estatisticas(self):
+        """
+        Retorna um dicionário com os contadores do cache, pronto para ser
+        exportado para um sistema de métricas.
+        """
+        with self._trava:
+            consultas = self.acertos + self.falhas
+            return {
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "remocoes": self.remocoes,
+                "itens": len(self._itens),
+                "bytes": self._bytes,
+                "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+            }
+
+    def __len__(self):
+        return len(self._itens)
+
+
+def memoizar(max_itens=128, max_bytes=None):
+    """
+    Decorador que memoiza uma função pura usando um CacheMemoizacao.
+    
+    A função decorada ganha os atributos:
+        cache: o CacheMemoizacao usado
+        invalidar(*args, **kwargs): remove o resultado desses argumentos
+    
+    Para memoizar também as chamadas recursivas, o nome global da
+    função deve apontar para a versão decorada, por exemplo:
+        fibonacci_recursivo = memoizar(256)(fibonacci_recursivo)
+    """
+    def decorador(funcao):
+        cache = CacheMemoizacao(max_itens, max_bytes)
+
+        def montar_chave(args, kwargs):
+            if kwargs:
+                return args + tuple(sorted(kwargs.items()))
+            return args
+
+        @functools.wraps(funcao)
+        def funcao_memoizada(*args, **kwargs):
+            chave = montar_chave(args, kwargs)
+            
+            achou, valor = cache.obter(chave)
+            if achou:
+                return valor
+            
+            # Calcula fora da trava para permitir recursão e concorrência
+            valor = funcao(*args, **kwargs)
+            cache.guardar(chave, valor)
+            return valor
+
+        def invalidar(*args, **kwargs):
+            return cache.invalidar(montar_chave(args, kwargs))
+        
+        funcao_memoizada.cache = cache
+        funcao_memoizada.invalidar = invalidar
+        return funcao_memoizada
+    
+    return decorador
+
+
+def main():
+    """
+    Demonstra a memoização limitada aplicada às funções do capítulo.
+    """
+    import fibonacci_recursivo as modulo_fibonacci
+    import fatorial_recursivo as modulo_fatorial
+    
+    # Substitui o nome global para que as chamadas recursivas usem o cache
+    modulo_fibonacci.fibonacci_recursivo = memoizar(max_itens=64)(
+        modulo_fibonacci.fibonacci_recursivo)
+    fibonacci = modulo_fibonacci.fibonacci_recursivo
+    
+    print("F(30) =", fibonacci(30))
+    print("F(200) =", fibonacci(200))
+    print("Estatísticas:", fibonacci.cache.estatisticas())
+    
+    # Invalidação explícita de um resultado
+    fibonacci.invalidar(200)
+    print("F(200) =", fibonacci(200))
+    print("Estatísticas:", fibonacci.cache.estatisticas())
+    
+    # Cache limitado pelo tamanho total dos valores (inteiros grandes)
+    modulo_fatorial.fatorial_recursivo = memoizar(max_itens=None, max_bytes=64 * 1024)(
+        modulo_fatorial.fatorial_recursivo)
+    fatorial = modulo_fatorial.fatorial_recursivo
+    
+    for n in range(100, 901, 100):
+        fatorial(n)
+    print("\nFatoriais de 100 a 900:", fatorial.cache.estatisticas())
+
+
+# Ponto de entrada do programa
+if __name__ == "__main__":
+    main()
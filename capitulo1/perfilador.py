@@ -0,0 +1,223 @@
+import functools
+import json
+import time
+
+
+def _resumir_argumentos(argumentos):
+    """
+    Chave de contagem de tamanho limitado para argumentos não hasheáveis:
+    valores hasheáveis ficam como estão e os demais (listas, dicionários...)
+    viram (tipo, tamanho). Assim rastrear um merge_sort não guarda uma
+    cópia em texto de cada sublista. Chamadas com listas diferentes de
+    mesmo tamanho contam como repetidas.
+    """
+    resumo = []
+    for valor in argumentos:
+        if isinstance(valor, tuple):
+            resumo.append(_resumir_argumentos(valor))
+            continue
+        try:
+            hash(valor)
+            resumo.append(valor)
+        except TypeError:
+            tamanho = len(valor) if hasattr(valor, "__len__") else None
+            resumo.append((type(valor).__name__, tamanho))
+    return tuple(resumo)
+
+
+class Perfilador:
+    """
+    Registra a árvore de chamadas de funções (em especial as recursivas):
+    quantas vezes cada função foi chamada com cada argumento, a
+    profundidade máxima alcançada e o tempo gasto em cada chamada.
+    
+    Quando criado com ativo=False, rastrear() devolve a própria função,
+    sem nenhum envoltório: o perfilador desligado não custa nada.
+    
+    Atributos:
+        ativo (bool): se as funções decoradas devem ser rastreadas
+        registrar_arvore (bool): se a árvore completa de chamadas deve ser
+                                 guardada (pode ocupar muita memória)
+    """
+
+    def __init__(self, ativo=True, registrar_arvore=True):
+        self.ativo = ativo
+        self.registrar_arvore = registrar_arvore
+        self.resetar()
+
+    def resetar(self):
+        """Descarta todas as medições feitas até agora."""
+        self.contagens = {}            # função -> {argumentos: chamadas}
+        self.profundidade_maxima = 0
+        self.tempo_total = 0.0         # tempo das chamadas de nível mais alto
+        self.raizes = []               # chamadas de nível mais alto
+        self._pilha = []               # chamadas em andamento
+
+    def rastrear(self, funcao):
+        """
+        Decorador que registra as chamadas da função.
+        
+        Para rastrear também as chamadas recursivas, o nome global da
+        função deve apontar para a versão decorada, por exemplo:
+            fibonacci_recursivo = perfilador.rastrear(fibonacci_recursivo)
+        """
+        # Perfilador desligado: nenhuma sobrecarga
+        if not self.ativo:
+            return funcao
+        
+        nome = funcao.__name__
+
+        @functools.wraps(funcao)
+        def funcao_rastreada(*args, **kwargs):
+            argumentos = args + tuple(sorted(kwargs.items())) if kwargs else args
+            
+            # Conta a chamada para esses argumentos; listas e dicionários
+            # não podem ser chave de dicionário, então usa um resumo deles
+            por_argumento = self.contagens.setdefault(nome, {})
+            try:
+                por_argumento[argumentos] = por_argumento.get(argumentos, 0) + 1
+            except TypeError:
+                chave = _resumir_argumentos(argumentos)
+                por_argumento[chave] = por_argumento.get(chave, 0) + 1
+            
+            # Cria o nodo da chamada e o pendura na chamada atual; o texto
+            # dos argumentos só é montado se a árvore for guardada
+            nodo = {"funcao": nome, "tempo": 0.0, "filhos": []}
+            if self.registrar_arvore:
+                nodo["argumentos"] = repr(argumentos)
+                if self._pilha:
+                    self._pilha[-1]["filhos"].append(nodo)
+                else:
+                    self.raizes.append(nodo)
+            
+            self._pilha.append(nodo)
+            if len(self._pilha) > self.profundidade_maxima:
+                self.profundidade_maxima = len(self._pilha)
+            
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                nodo["tempo"] = time.perf_counter() - inicio
+                self._pilha.pop()
+                if not self._pilha:
+                    self.tempo_total += nodo["tempo"]
+        
+        return funcao_rastreada
+
+    # ==================== RESUMOS ====================
+
+    def total_chamadas(self, nome=None):
+        """Total de chamadas registradas (de uma função ou de todas)."""
+        nomes = [nome] if nome is not None else list(self.contagens)
+        return sum(sum(self.contagens.get(n, {}).values()) for n in nomes)
+
+    def chamadas_repetidas(self, nome=None):
+        """
+        Quantidade de chamadas com argumentos que já tinham sido vistos,
+        ou seja, o trabalho redundante que a memoização eliminaria.
+        """
+        nomes = [nome] if nome is not None else list(self.contagens)
+        repetidas = 0
+        for n in nomes:
+            for quantidade in self.contagens.get(n, {}).values():
+                repetidas += quantidade - 1
+        return repetidas
+
+    # ==================== EXPORTAÇÃO ====================
+
+    def exportar_json(self, indentacao=None):
+        """Exporta a árvore de chamadas como texto JSON."""
+        return json.dumps({
+            "profundidade_maxima": self.profundidade_maxima,
+            "tempo_total": self.tempo_total,
+            "chamadas": self.raizes,
+        }, indent=indentacao, ensure_ascii=False)
+
+    def exportar_folded(self, com_argumentos=False):
+        """
+        Exporta a árvore no formato "folded stacks" usado por ferramentas
+        de flamegraph: uma linha por pilha de chamadas, com os quadros
+        separados por ';' e o tempo próprio (sem os filhos) em microssegundos.
+        Pilhas iguais são somadas.
+        """
+        totais = {}
+        
+        # Percorre a árvore com uma pilha explícita (a árvore pode ser
+        # mais profunda que o limite de recursão)
+        pilha = [(nodo, "") for nodo in reversed(self.raizes)]
+        while pilha:
+            nodo, prefixo = pilha.pop()
+            
+            quadro = nodo["funcao"]
+            if com_argumentos:
+                # O espaço separa a pilha do valor, então não pode aparecer no quadro
+                quadro += nodo["argumentos"].replace(" ", "")
+            caminho = prefixo + ";" + quadro if prefixo else quadro
+            
+            tempo_proprio = nodo["tempo"] - sum(filho["tempo"] for filho in nodo["filhos"])
+            totais[caminho] = totais.get(caminho, 0.0) + max(tempo_proprio, 0.0)
+            
+            for filho in reversed(nodo["filhos"]):
+                pilha.append((filho, caminho))
+        
+        return "\n".join(f"{caminho} {round(tempo * 1e6)}" for caminho, tempo in totais.items())
+
+
+def main():
+    """
+    Mede o trabalho redundante de fibonacci_recursivo antes e depois
+    da memoização.
+    """
+    import fibonacci_recursivo as modulo_fibonacci
+    from memoizacao import memoizar
+    
+    original = modulo_fibonacci.fibonacci_recursivo
+    
+    # Sem memoização
+    perfilador = Perfilador()
+    modulo_fibonacci.fibonacci_recursivo = perfilador.rastrear(original)
+    modulo_fibonacci.fibonacci_recursivo(20)
+    
+    print("=== fibonacci_recursivo(20) sem memoização ===")
+    print(f"Chamadas: {perfilador.total_chamadas()}")
+    print(f"Chamadas repetidas: {perfilador.chamadas_repetidas()}")
+    print(f"Profundidade máxima: {perfilador.profundidade_maxima}")
+    print(f"Tempo total: {perfilador.tempo_total * 1000:.2f} ms")
+    
+    # Com memoização: o cache fica por fora, então só os cálculos
+    # realmente executados chegam ao perfilador
+    perfilador = Perfilador()
+    modulo_fibonacci.fibonacci_recursivo = memoizar(max_itens=64)(perfilador.rastrear(original))
+    modulo_fibonacci.fibonacci_recursivo(20)
+    
+    print("\n=== fibonacci_recursivo(20) com memoização ===")
+    print(f"Chamadas: {perfilador.total_chamadas()}")
+    print(f"Chamadas repetidas: {perfilador.chamadas_repetidas()}")
+    print(f"Profundidade máxima: {perfilador.profundidade_maxima}")
+    print(f"Tempo total: {perfilador.tempo_total * 1000:.2f} ms")
+    
+    print("\nPilhas no formato folded (primeiras linhas):")
+    for linha in perfilador.exportar_folded(com_argumentos=True).splitlines()[:5]:
+        print(" ", linha)
+    
+    modulo_fibonacci.fibonacci_recursivo = original
+
+    # Funções que recebem listas também podem ser rastreadas; sem a árvore,
+    # cada lista é contada só pelo tipo e tamanho
+    perfilador = Perfilador(registrar_arvore=False)
+
+    def soma_recursiva(lista):
+        if not lista:
+            return 0
+        return lista[0] + soma_recursiva(lista[1:])
+    
+    soma_recursiva = perfilador.rastrear(soma_recursiva)
+    print(f"\nsoma_recursiva([3, 1, 2]) = {soma_recursiva([3, 1, 2])}")
+    print(f"Chamadas: {perfilador.total_chamadas()}")
+    print(f"Contagens: {perfilador.contagens}")
+
+
+# Ponto de entrada do programa
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+def _reduzir(polinomio, coeficientes, modulo):
+    """
+    Reduz um polinômio módulo o polinômio característico da recorrência
+    P(x) = x^k - c1·x^(k-1) - ... - ck.
+    Usa a identidade x^k = c1·x^(k-1) + c2·x^(k-2) + ... + ck para
+    eliminar os graus maiores ou iguais a k, do maior para o menor.
+    """
+    k = len(coeficientes)
+
+    for grau in range(len(polinomio) - 1, k - 1, -1):
+        termo = polinomio[grau]
+        if termo:
+            # x^grau = x^(grau-k) · x^k = soma de cj · x^(grau-j)
+            for j in range(1, k + 1):
+                polinomio[grau - j] += termo * coeficientes[j - 1]
+            polinomio[grau] = 0
+    
+    resultado = polinomio[:k]
+    if modulo is not None:
+        resultado = [termo % modulo for termo in resultado]
+    return resultado
+
+
+def _multiplicar(p, q, coeficientes, modulo):
+    """Multiplica dois polinômios de grau < k e reduz o resultado."""
+    produto = [0] * (len(p) + len(q) - 1)
+    for i, termo_p in enumerate(p):
+        if termo_p:
+            for j, termo_q in enumerate(q):
+                produto[i + j] += termo_p * termo_q
+    return _reduzir(produto, coeficientes, modulo)
+
+
+def termo_recorrencia(coeficientes, iniciais, n, modulo=None):
+    """
+    Calcula o n-ésimo termo de uma recorrência linear de ordem k
+        a(m) = c1·a(m-1) + c2·a(m-2) + ... + ck·a(m-k)
+    usando o algoritmo de Kitamasa em O(k² log n) operações.
+    
+    Parâmetros:
+        coeficientes: lista [c1, c2, ..., ck]
+        iniciais: os k primeiros termos [a(1), a(2), ..., a(k)]
+        n: índice do termo desejado (base-1, como em fibonacci_recursivo)
+        modulo: se informado, o resultado é calculado módulo esse valor
+    
+    Exemplo: Fibonacci do livro (F(1) = 0, F(2) = 1)
+        termo_recorrencia([1, 1], [0, 1], n)
+    """
+    k = len(coeficientes)
+    
+    # Validação de entrada
+    if k == 0 or len(iniciais) != k:
+        raise ValueError("São necessários k coeficientes e k termos iniciais")
+    if n <= 0:
+        raise ValueError("O índice deve ser um inteiro positivo")
+    if modulo is not None and modulo <= 0:
+        raise ValueError("Módulo deve ser um inteiro positivo")
+    
+    # Os primeiros k termos são dados diretamente
+    if n <= k:
+        termo = iniciais[n - 1]
+        return termo if modulo is None else termo % modulo
+    
+    # Calcula x^(n-1) mod P(x) por exponenciação binária.
+    # Cada bit eleva ao quadrado e, se for 1, multiplica por x.
+    expoente = n - 1
+    potencia = [1] + [0] * (k - 1)
+    for bit in bin(expoente)[2:]:
+        potencia = _multiplicar(potencia, potencia, coeficientes, modulo)
+        if bit == "1":
+            # Multiplicar por x desloca os coeficientes um grau acima
+            potencia = _reduzir([0] + potencia, coeficientes, modulo)
+    
+    # Se x^(n-1) = r0 + r1·x + ... + r(k-1)·x^(k-1),
+    # então a(n) = r0·a(1) + r1·a(2) + ... + r(k-1)·a(k)
+    resultado = 0
+    for r, termo in zip(potencia, iniciais):
+        resultado += r * termo
+    return resultado if modulo is None else resultado % modulo
+
+
+def main():
+    """
+    Demonstra o cálculo de termos de recorrências lineares.
+    """
+    # Fibonacci na convenção do livro: F(1) = 0, F(2) = 1
+    print("Fibonacci F(10) =", termo_recorrencia([1, 1], [0, 1], 10))
+    print("Fibonacci F(10^18) mod 10^9+7 =",
+          termo_recorrencia([1, 1], [0, 1], 10 ** 18, 10 ** 9 + 7))
+    
+    # Tribonacci: T(m) = T(m-1) + T(m-2) + T(m-3), começando em 0, 0, 1
+    tribonacci = [termo_recorrencia([1, 1, 1], [0, 0, 1], n) for n in range(1, 13)]
+    print("Tribonacci:", tribonacci)
+    
+    # Recorrência com coeficientes quaisquer: a(m) = 2·a(m-1) - a(m-2) + 3·a(m-4)
+    print("a(10^12) mod 998244353 =",
+          termo_recorrencia([2, -1, 0, 3], [1, 2, 3, 4], 10 ** 12, 998244353))
+
+
+# Ponto de entrada do programa
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+import math
+import numbers
+
+
+def busca_binaria_sondagens(dados, valor_procurado):
+    """
+    Busca binária que também conta as sondagens (acessos a dados[meio]).
+    Retorna uma tupla (posicao, sondagens), com a posição em base-1
+    ou -1 caso o valor não seja encontrado.
+    """
+    inicio = 0
+    fim = len(dados) - 1
+    sondagens = 0
+    
+    while inicio <= fim:
+        meio = (inicio + fim) // 2
+        sondagens += 1
+        
+        if dados[meio] == valor_procurado:
+            return meio + 1, sondagens
+        elif dados[meio] < valor_procurado:
+            inicio = meio + 1
+        else:
+            fim = meio - 1
+    
+    return -1, sondagens
+
+
+def busca_interpolacao(dados, valor_procurado):
+    """
+    Busca por interpolação em uma lista ordenada de números.
+    Em vez de olhar sempre o meio, estima onde o valor deveria estar
+    supondo que os dados crescem de forma aproximadamente linear:
+        
+        pos = inicio + (valor - dados[inicio]) × (fim - inicio) / (dados[fim] - dados[inicio])
+    
+    Em dados uniformemente distribuídos faz O(log log n) sondagens.
+    Retorna uma tupla (posicao, sondagens), com a posição em base-1
+    ou -1 caso o valor não seja encontrado.
+    """
+    inicio = 0
+    fim = len(dados) - 1
+    sondagens = 0
+    
+    # O valor só pode estar no trecho se estiver entre as suas extremidades
+    while inicio <= fim and dados[inicio] <= valor_procurado <= dados[fim]:
+        # Trecho com todos os valores iguais: não há o que interpolar
+        if dados[fim] == dados[inicio]:
+            posicao = inicio
+        else:
+            posicao = inicio + int((valor_procurado - dados[inicio]) * (fim - inicio)
+                                   // (dados[fim] - dados[inicio]))
+        sondagens += 1
+        
+        if dados[posicao] == valor_procurado:
+            return posicao + 1, sondagens
+        elif dados[posicao] < valor_procurado:
+            inicio = posicao + 1
+        else:
+            fim = posicao - 1
+    
+    return -1, sondagens
+
+
+def busca_exponencial(dados, valor_procurado):
+    """
+    Busca exponencial (galopante) em uma lista ordenada.
+    Dobra o limite (1, 2, 4, 8, ...) até passar do valor procurado e
+    depois faz uma busca binária só nesse último intervalo.
+    Faz O(log p) sondagens, onde p é a posição do valor: é ideal quando
+    os valores procurados costumam estar perto do início da lista.
+    Retorna uma tupla (posicao, sondagens), com a posição em base-1
+    ou -1 caso o valor não seja encontrado.
+    """
+    n = len(dados)
+    if n == 0:
+        return -1, 0
+    
+    # Primeiro elemento
+    sondagens = 1
+    if dados[0] == valor_procurado:
+        return 1, sondagens
+    
+    # Galopa dobrando o limite enquanto os elementos forem menores
+    limite = 1
+    while limite < n and dados[limite] < valor_procurado:
+        sondagens += 1
+        limite *= 2
+    if limite < n:
+        sondagens += 1  # a comparação que interrompeu o galope
+    
+    # Busca binária entre o limite anterior e o atual
+    inicio = limite // 2
+    fim = min(limite, n - 1)
+    while inicio <= fim:
+        meio = (inicio + fim) // 2
+        sondagens += 1
+        
+        if dados[meio] == valor_procurado:
+            return meio + 1, sondagens
+        elif dados[meio] < valor_procurado:
+            inicio = meio + 1
+        else:
+            fim = meio - 1
+    
+    return -1, sondagens
+
+
+class BuscaAdaptativa:
+    """
+    Escolhe a estratégia de busca mais barata para uma lista ordenada:
+    
+    - interpolação, se uma amostra dos dados indicar distribuição
+      aproximadamente uniforme (crescimento quase linear);
+    - exponencial, se os valores encontrados costumam ficar perto do início;
+    - binária, nos demais casos.
+    
+    A estimativa de custo de cada estratégia (em sondagens) é:
+        binária:      log2(n)
+        exponencial:  2 × log2(posição média dos valores encontrados)
+        interpolação: log2(log2(n)), apenas para dados uniformes
+    
+    Atributos:
+        uniforme (bool): resultado da amostragem dos dados
+        sondagens (dict): total de sondagens feitas por estratégia
+        consultas (dict): quantidade de consultas por estratégia
+    """
+    
+    ESTRATEGIAS = {
+        "binaria": busca_binaria_sondagens,
+        "interpolacao": busca_interpolacao,
+        "exponencial": busca_exponencial,
+    }
+
+    def __init__(self, dados, amostras=32, tolerancia=0.05):
+        self.dados = dados
+        self.uniforme = self._amostrar_uniformidade(amostras, tolerancia)
+        
+        # Média móvel da posição dos valores encontrados; começa no meio
+        # para não favorecer nenhuma estratégia
+        self.posicao_media = len(dados) / 2
+        
+        self.sondagens = {nome: 0 for nome in self.ESTRATEGIAS}
+        self.consultas = {nome: 0 for nome in self.ESTRATEGIAS}
+
+    def _amostrar_uniformidade(self, amostras, tolerancia):
+        """
+        Compara alguns elementos igualmente espaçados com a reta que liga
+        o primeiro ao último elemento. Se todos ficarem próximos da reta
+        (desvio relativo até a tolerância), os dados são considerados
+        uniformes.
+        """
+        n = len(self.dados)
+        if n < 2:
+            return False
+        
+        primeiro = self.dados[0]
+        ultimo = self.dados[-1]
+        
+        # Interpolação só faz sentido para números
+        for extremo in (primeiro, ultimo):
+            if not isinstance(extremo, numbers.Real) or isinstance(extremo, bool):
+                return False
+        if ultimo == primeiro:
+            return False
+        
+        amostras = min(amostras, n)
+        for j in range(amostras):
+            indice = j * (n - 1) // max(amostras - 1, 1)
+            esperado = primeiro + (ultimo - primeiro) * indice / (n - 1)
+            if abs(self.dados[indice] - esperado) / (ultimo - primeiro) > tolerancia:
+                return False
+        
+        return True
+
+    def escolher_estrategia(self):
+        """Retorna o nome da estratégia com menor custo estimado."""
+        n = len(self.dados)
+        custos = {
+            "binaria": math.log2(n + 1),
+            "exponencial": 2 * math.log2(self.posicao_media + 2),
+        }
+        if self.uniforme:
+            custos["interpolacao"] = math.log2(math.log2(n + 2) + 1) + 1
+        
+        return min(custos, key=custos.get)
+
+    def buscar(self, valor_procurado):
+        """
+        Busca um valor com a estratégia escolhida.
+        Retorna a posição (base-1) se encontrado, ou -1 caso contrário.
+        """
+        estrategia = self.escolher_estrategia()
+        posicao, sondagens = self.ESTRATEGIAS[estrategia](self.dados, valor_procurado)
+        
+        self.sondagens[estrategia] += sondagens
+        self.consultas[estrategia] += 1
+        
+        # Atualiza a posição média dos valores encontrados
+        if posicao != -1:
+            self.posicao_media = 0.9 * self.posicao_media + 0.1 * posicao
+        
+        return posicao
+
+    def relatorio(self):
+        """Retorna, por estratégia, as consultas e a média de sondagens."""
+        relatorio = {}
+        for nome in self.ESTRATEGIAS:
+            consultas = self.consultas[nome]
+            if consultas:
+                relatorio[nome] = {
+                    "consultas": consultas,
+                    "sondagens_media": self.sondagens[nome] / consultas,
+                }
+        return relatorio
+
+
+def comparar_sondagens(dados, consultas, titulo):
+    """Mostra a média de sondagens de cada estratégia para as consultas."""
+    print(f"\n=== {titulo} ===")
+    
+    for nome, funcao in BuscaAdaptativa.ESTRATEGIAS.items():
+        total = 0
+        for valor in consultas:
+            total += funcao(dados, valor)[1]
+        print(f"  {nome:<13} {total / len(consultas):6.2f} sondagens/consulta")
+    
+    adaptativa = BuscaAdaptativa(dados)
+    for valor in consultas:
+        adaptativa.buscar(valor)
+    total = sum(adaptativa.sondagens.values())
+    print(f"  {'adaptativa':<13} {total / len(consultas):6.2f} sondagens/consulta "
+          f"(escolheu: {', '.join(adaptativa.relatorio())})")
+
+
+def main():
+    """
+    Compara as estratégias de busca em diferentes cenários.
+    """
+    import random
+    
+    n = 1000000
+    
+    # Chaves uniformemente distribuídas: interpolação vence
+    uniformes = sorted(random.sample(range(n * 10), n))
+    consultas = random.sample(uniformes, 1000)
+    comparar_sondagens(uniformes, consultas, "Chaves uniformes")
+    
+    # Chaves com distribuição muito desigual (quadrática)
+    quadraticas = [i * i for i in range(n)]
+    consultas = random.sample(quadraticas, 1000)
+    comparar_sondagens(quadraticas, consultas, "Chaves quadráticas")
+    
+    # Valores procurados perto do início: busca exponencial vence
+    consultas = [quadraticas[random.randint(0, 50)] for _ in range(1000)]
+    comparar_sondagens(quadraticas, consultas, "Consultas perto do início")
+
+
+# Ponto de entrada do programa
+if __name__ == "__main__":
+    main()
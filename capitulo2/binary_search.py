@@ -1,8 +1,19 @@
+# NumPy é opcional: sem ele, apenas a versão em Python puro é usada
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def busca_binaria(dados, valor_procurado):
     """
     Realiza busca binária em uma lista ordenada.
     Retorna a posição (base-1) se encontrado, ou -1 caso contrário.
     """
+    # Vetores NumPy usam a versão vetorizada
+    if np is not None and isinstance(dados, np.ndarray):
+        return busca_binaria_numpy(dados, valor_procurado)
+    
     inicio = 0
     fim = len(dados) - 1
     achou = 0
@@ -24,6 +35,199 @@ def busca_binaria(dados, valor_procurado):
     else:
         return posicao + 1
 
+def limite_inferior(dados, valor_procurado, key=None):
+    """
+    Retorna a quantidade de elementos menores que valor_procurado em uma
+    lista ordenada, ou seja, o índice (base-0) da primeira posição onde
+    o valor poderia ser inserido mantendo a ordem (como bisect_left).
+    
+    Se key for informada, compara key(dados[i]) com valor_procurado.
+    A função é aplicada só aos elementos visitados, sem criar uma cópia
+    decorada da lista: o custo continua O(log n).
+    """
+    inicio = 0
+    fim = len(dados)
+    
+    while inicio < fim:
+        meio = (inicio + fim) // 2
+        elemento = dados[meio] if key is None else key(dados[meio])
+        
+        if elemento < valor_procurado:
+            inicio = meio + 1
+        else:
+            fim = meio
+    
+    return inicio
+
+
+def limite_superior(dados, valor_procurado, key=None):
+    """
+    Retorna a quantidade de elementos menores ou iguais a valor_procurado
+    em uma lista ordenada, ou seja, o índice (base-0) da última posição
+    onde o valor poderia ser inserido mantendo a ordem (como bisect_right).
+    
+    Se key for informada, compara key(dados[i]) com valor_procurado.
+    """
+    inicio = 0
+    fim = len(dados)
+    
+    while inicio < fim:
+        meio = (inicio + fim) // 2
+        elemento = dados[meio] if key is None else key(dados[meio])
+        
+        if valor_procurado < elemento:
+            fim = meio
+        else:
+            inicio = meio + 1
+    
+    return inicio
+
+
+def intervalo_igual(dados, valor_procurado, key=None):
+    """
+    Retorna a tupla (inicio, fim) tal que dados[inicio:fim] contém todos
+    os elementos iguais a valor_procurado (vazio se não houver nenhum).
+    """
+    return (limite_inferior(dados, valor_procurado, key),
+            limite_superior(dados, valor_procurado, key))
+
+
+def contar_ocorrencias(dados, valor_procurado, key=None):
+    """
+    Conta quantos elementos de uma lista ordenada são iguais a
+    valor_procurado em O(log n), com duas buscas binárias.
+    """
+    inicio, fim = intervalo_igual(dados, valor_procurado, key)
+    return fim - inicio
+
+
+def primeira_ocorrencia(dados, valor_procurado, key=None):
+    """
+    Retorna a posição (base-1) da primeira ocorrência de valor_procurado
+    em uma lista ordenada, ou -1 caso ele não exista.
+    Ao contrário de busca_binaria, a posição é sempre a primeira, mesmo
+    com valores repetidos.
+    """
+    posicao = limite_inferior(dados, valor_procurado, key)
+    
+    if posicao < len(dados):
+        elemento = dados[posicao] if key is None else key(dados[posicao])
+        if elemento == valor_procurado:
+            return posicao + 1
+    
+    return -1
+
+
+def busca_binaria_lote(dados, valores):
+    """
+    Procura vários valores de uma só vez em uma lista ordenada.
+    Retorna uma lista com a posição (base-1) de cada valor, ou -1 caso
+    o valor não seja encontrado, na mesma ordem dos valores consultados.
+    
+    Se os valores consultados já estiverem ordenados e forem muitos,
+    percorre as duas listas juntas (intercalação com dois índices) em
+    O(n + m). Caso contrário faz uma busca binária por valor, em
+    O(m log n), sem o custo de uma chamada de função por consulta.
+    
+    Observação: se a lista tiver valores repetidos, a intercalação
+    devolve a primeira ocorrência e a busca binária uma ocorrência
+    qualquer, assim como busca_binaria.
+    
+    Para vetores NumPy o resultado é um vetor NumPy.
+    """
+    import math
+    
+    # Vetores NumPy usam a versão vetorizada
+    if np is not None and isinstance(dados, np.ndarray):
+        return busca_binaria_numpy_lote(dados, valores)
+    
+    valores = list(valores)
+    n = len(dados)
+    m = len(valores)
+    resultado = []
+    
+    if m == 0:
+        return resultado
+    
+    # Verifica se as consultas estão em ordem crescente
+    consultas_ordenadas = True
+    for i in range(m - 1):
+        if valores[i + 1] < valores[i]:
+            consultas_ordenadas = False
+            break
+    
+    # Intercalação: vale a pena quando n + m < m × log2(n)
+    if consultas_ordenadas and n + m < m * math.log2(n + 1):
+        i = 0
+        for valor in valores:
+            # Avança na lista até o primeiro elemento >= valor
+            while i < n and dados[i] < valor:
+                i += 1
+            
+            if i < n and dados[i] == valor:
+                resultado.append(i + 1)
+            else:
+                resultado.append(-1)
+        return resultado
+    
+    # Busca binária para cada valor (mesmo laço de busca_binaria)
+    for valor in valores:
+        inicio = 0
+        fim = n - 1
+        posicao = -1
+        
+        while inicio <= fim:
+            meio = (inicio + fim) // 2
+            
+            if dados[meio] == valor:
+                posicao = meio + 1
+                break
+            elif dados[meio] < valor:
+                inicio = meio + 1
+            else:
+                fim = meio - 1
+        
+        resultado.append(posicao)
+    
+    return resultado
+
+
+def busca_binaria_numpy(dados, valor_procurado):
+    """
+    Busca binária em um vetor NumPy ordenado usando np.searchsorted.
+    Retorna a posição (base-1) da primeira ocorrência, ou -1.
+    """
+    if dados.ndim != 1:
+        raise ValueError("A busca só aceita vetores NumPy unidimensionais")
+    
+    posicao = int(np.searchsorted(dados, valor_procurado))
+    if posicao < dados.size and dados[posicao] == valor_procurado:
+        return posicao + 1
+    return -1
+
+
+def busca_binaria_numpy_lote(dados, valores):
+    """
+    Busca binária vetorizada de vários valores em um vetor NumPy ordenado.
+    Retorna um vetor NumPy com a posição (base-1) da primeira ocorrência
+    de cada valor, ou -1 para os valores não encontrados.
+    """
+    if dados.ndim != 1:
+        raise ValueError("A busca só aceita vetores NumPy unidimensionais")
+    
+    valores = np.asarray(valores)
+    if dados.size == 0:
+        return np.full(valores.shape, -1, dtype=np.int64)
+    
+    posicoes = np.searchsorted(dados, valores)
+    
+    # Limita as posições para poder indexar e confere se o valor existe
+    limitadas = np.minimum(posicoes, dados.size - 1)
+    encontrados = (posicoes < dados.size) & (dados[limitadas] == valores)
+    
+    return np.where(encontrados, posicoes + 1, -1).astype(np.int64)
+
+
 def main():
         
     import random
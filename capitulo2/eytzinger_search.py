@@ -0,0 +1,203 @@
+from array import array
+
+# NumPy é opcional: sem ele, os backends "lista" e "array" continuam disponíveis
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class IndiceEytzinger:
+    """
+    Índice para buscas binárias repetidas em uma lista ordenada estática.
+    
+    Os elementos são reorganizados no layout de Eytzinger: a ordem em
+    largura (BFS) de uma árvore binária de busca completa. A raiz fica
+    na posição 1 e os filhos do nodo k ficam nas posições 2k e 2k+1.
+    Assim os primeiros níveis, visitados por todas as buscas, ficam
+    juntos na memória, e a busca só desce "para a esquerda ou direita"
+    sem precisar calcular o meio de um intervalo.
+    
+    Atributos:
+        backend (str): "lista", "array" (módulo array) ou "numpy"
+        tamanho (int): quantidade de elementos indexados
+    """
+
+    def __init__(self, dados, backend="lista"):
+        if backend not in ("lista", "array", "numpy"):
+            raise ValueError("backend deve ser 'lista', 'array' ou 'numpy'")
+        if backend == "numpy" and np is None:
+            raise ImportError("O backend 'numpy' requer o pacote NumPy")
+        
+        self.backend = backend
+        self.tamanho = len(dados)
+        
+        # Posição 0 não é usada; elementos[k] é o nodo k da árvore e
+        # posicoes[k] é o índice (base-0) desse elemento na lista ordenada
+        elementos = [None] * (self.tamanho + 1)
+        posicoes = [0] * (self.tamanho + 1)
+        self._preencher(dados, elementos, posicoes)
+        
+        # A posição 0 recebe um valor qualquer do mesmo tipo dos dados
+        elementos[0] = dados[0] if self.tamanho > 0 else 0
+        
+        if backend == "lista":
+            self.elementos = elementos
+            self.posicoes = posicoes
+        elif backend == "array":
+            self.elementos = array(self._tipo_array(dados), elementos)
+            self.posicoes = array("q", posicoes)
+        else:
+            self.elementos = np.asarray(elementos)
+            self.posicoes = np.asarray(posicoes, dtype=np.int64)
+
+    @staticmethod
+    def _tipo_array(dados):
+        """Escolhe o código de tipo do módulo array para os dados."""
+        if all(isinstance(valor, int) and not isinstance(valor, bool) for valor in dados):
+            return "q"  # inteiros de 64 bits
+        if all(isinstance(valor, (int, float)) for valor in dados):
+            return "d"  # ponto flutuante de precisão dupla
+        raise TypeError("O backend 'array' aceita apenas números")
+
+    def _preencher(self, dados, elementos, posicoes):
+        """
+        Percorre a árvore implícita em ordem (esquerda, nodo, direita)
+        usando uma pilha, e vai colocando os elementos da lista ordenada
+        em sequência: assim cada nodo recebe o elemento correto.
+        """
+        n = self.tamanho
+        i = 0
+        pilha = []
+        k = 1
+        
+        while pilha or k <= n:
+            # Desce o máximo possível pela esquerda
+            while k <= n:
+                pilha.append(k)
+                k = 2 * k
+            
+            k = pilha.pop()
+            elementos[k] = dados[i]
+            posicoes[k] = i
+            i += 1
+            
+            # Segue para a subárvore direita
+            k = 2 * k + 1
+
+    def _limite_inferior(self, valor_procurado):
+        """
+        Retorna o nodo com o primeiro elemento >= valor_procurado,
+        ou 0 se todos forem menores.
+        """
+        elementos = self.elementos
+        n = self.tamanho
+        k = 1
+        
+        # Desce sem desvios: o resultado da comparação (0 ou 1) escolhe o filho
+        while k <= n:
+            k = 2 * k + int(elementos[k] < valor_procurado)
+        
+        # Os bits finais 1 de k são as descidas à direita depois do último
+        # nodo >= valor; remove-os junto com o último 0 para voltar a ele
+        return k >> (~k & (k + 1)).bit_length()
+
+    def buscar(self, valor_procurado):
+        """
+        Busca um valor. Retorna a posição (base-1) da primeira ocorrência
+        na lista ordenada original, ou -1 caso não seja encontrado.
+        """
+        k = self._limite_inferior(valor_procurado)
+        
+        if k != 0 and self.elementos[k] == valor_procurado:
+            return int(self.posicoes[k]) + 1
+        return -1
+
+    def buscar_lote(self, valores):
+        """
+        Busca vários valores. Retorna uma lista com a posição (base-1) de
+        cada um, ou -1. Com o backend "numpy", todas as consultas descem
+        a árvore juntas, um nível por vez, e o resultado é um vetor NumPy.
+        """
+        if self.backend != "numpy":
+            return [self.buscar(valor) for valor in valores]
+        
+        valores = np.asarray(valores)
+        n = self.tamanho
+        if n == 0:
+            return np.full(valores.shape, -1, dtype=np.int64)
+        
+        # Cada consulta desce um nível por iteração
+        k = np.ones(valores.shape, dtype=np.int64)
+        for _ in range(n.bit_length()):
+            ativos = k <= n
+            comparacao = self.elementos[np.minimum(k, n)] < valores
+            k = np.where(ativos, 2 * k + comparacao, k)
+        
+        # Remove os bits finais 1 e o último 0 (frexp devolve o bit_length)
+        menor_zero = ~k & (k + 1)
+        k = k >> np.frexp(menor_zero)[1]
+        
+        encontrados = (k != 0) & (self.elementos[k] == valores)
+        return np.where(encontrados, self.posicoes[k] + 1, -1)
+
+
+def comparar_desempenho(tamanhos=(10 ** 5, 10 ** 6), consultas=100000):
+    """
+    Compara busca_binaria com o índice de Eytzinger: tempo de construção
+    e tempo médio por consulta. Tamanhos de 10^7 ou 10^8 também funcionam,
+    mas exigem vários GB de memória com listas Python.
+    """
+    import random
+    import time
+    from binary_search import busca_binaria
+    
+    for tamanho in tamanhos:
+        dados = sorted(random.sample(range(tamanho * 4), tamanho))
+        valores = [random.randrange(tamanho * 4) for _ in range(consultas)]
+        print(f"\n=== {tamanho} elementos, {consultas} consultas ===")
+        
+        inicio = time.perf_counter()
+        esperado = [busca_binaria(dados, valor) for valor in valores]
+        tempo = time.perf_counter() - inicio
+        print(f"  {'busca_binaria':<22} construção {0:7.3f} s  {tempo / consultas * 1e6:6.2f} µs/consulta")
+        
+        backends = ["lista", "array"] + (["numpy"] if np is not None else [])
+        for backend in backends:
+            inicio = time.perf_counter()
+            indice = IndiceEytzinger(dados, backend)
+            tempo_construcao = time.perf_counter() - inicio
+            
+            inicio = time.perf_counter()
+            obtido = [indice.buscar(valor) for valor in valores]
+            tempo = time.perf_counter() - inicio
+            assert obtido == esperado
+            print(f"  {'eytzinger (' + backend + ')':<22} construção {tempo_construcao:7.3f} s"
+                  f"  {tempo / consultas * 1e6:6.2f} µs/consulta")
+            
+            if backend == "numpy":
+                inicio = time.perf_counter()
+                obtido = indice.buscar_lote(valores)
+                tempo = time.perf_counter() - inicio
+                assert obtido.tolist() == esperado
+                print(f"  {'eytzinger (numpy lote)':<22} {'':>18}  {tempo / consultas * 1e6:6.2f} µs/consulta")
+
+
+def main():
+    """
+    Demonstra o layout de Eytzinger e compara o desempenho.
+    """
+    dados = [10, 20, 30, 40, 50, 60, 70]
+    indice = IndiceEytzinger(dados)
+    
+    print("Lista ordenada:    ", dados)
+    print("Layout Eytzinger:  ", indice.elementos[1:])
+    print("Posição de 50:     ", indice.buscar(50))
+    print("Posição de 35:     ", indice.buscar(35))
+    
+    comparar_desempenho()
+
+
+# Ponto de entrada do programa
+if __name__ == "__main__":
+    main()
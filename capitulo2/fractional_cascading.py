@@ -0,0 +1,199 @@
+from binary_search import limite_inferior, limite_superior
+
+
+class CascataFracionaria:
+    """
+    Busca de um mesmo valor em K listas ordenadas, em O(log n + K)
+    em vez das O(K log n) de K buscas binárias separadas.
+    
+    Cada lista L_i ganha uma lista "mesclada" M_i: a intercalação de L_i
+    com um de cada dois elementos de M_{i+1} (a última é M_{K-1} = L_{K-1}).
+    Para cada posição q de M_i são guardados:
+        - proprio[q]: quantos elementos de M_i[:q] vieram de L_i;
+        - ponte[q]: quantos elementos de M_i[:q] vieram de M_{i+1}.
+    Só M_0 é percorrida com busca binária. Conhecendo a posição de
+    inserção q em M_i, proprio[q] já é a posição em L_i e ponte[q] indica
+    a posição em M_{i+1} com erro de no máximo um elemento, corrigido com
+    uma única comparação. O espaço total é no máximo o dobro das listas.
+    
+    Atributos:
+        listas (list): cópias das K listas ordenadas
+        niveis_reconstruidos (int): níveis reconstruídos por atualizações
+    """
+
+    def __init__(self, listas):
+        self.listas = [list(lista) for lista in listas]
+        quantidade = len(self.listas)
+        self._mesclados = [None] * quantidade
+        self._proprios = [None] * quantidade
+        self._pontes = [None] * quantidade
+        
+        # Maior nível desatualizado: todos os níveis de 0 até ele precisam
+        # ser reconstruídos, pois M_i depende de M_{i+1}
+        self._sujo = quantidade - 1
+        self.niveis_reconstruidos = 0
+        self._atualizar()
+
+    def _construir_nivel(self, i):
+        """Intercala L_i com os elementos de posição ímpar de M_{i+1}."""
+        lista = self.listas[i]
+        if i + 1 < len(self.listas):
+            promovidos = self._mesclados[i + 1][1::2]
+        else:
+            promovidos = []
+        
+        mesclado = []
+        proprio = [0]
+        ponte = [0]
+        a = b = 0
+        
+        while a < len(lista) or b < len(promovidos):
+            if b == len(promovidos) or (a < len(lista) and lista[a] <= promovidos[b]):
+                mesclado.append(lista[a])
+                a += 1
+            else:
+                mesclado.append(promovidos[b])
+                b += 1
+            proprio.append(a)
+            ponte.append(b)
+        
+        self._mesclados[i] = mesclado
+        self._proprios[i] = proprio
+        self._pontes[i] = ponte
+
+    def _atualizar(self):
+        """Reconstrói, de baixo para cima, os níveis alterados desde a última busca."""
+        for i in range(self._sujo, -1, -1):
+            self._construir_nivel(i)
+            self.niveis_reconstruidos += 1
+        self._sujo = -1
+
+    def inserir(self, indice_lista, valor):
+        """
+        Insere um valor na lista indice_lista (depois dos valores iguais).
+        A estrutura só é reconstruída na próxima busca, e apenas dos níveis
+        0 até o maior nível alterado: várias inserções seguidas custam uma
+        única reconstrução.
+        """
+        lista = self.listas[indice_lista]
+        lista.insert(limite_superior(lista, valor), valor)
+        self._sujo = max(self._sujo, indice_lista)
+
+    def remover(self, indice_lista, valor):
+        """Remove uma ocorrência do valor da lista indice_lista."""
+        lista = self.listas[indice_lista]
+        posicao = limite_inferior(lista, valor)
+        if posicao == len(lista) or lista[posicao] != valor:
+            raise ValueError("Valor não encontrado na lista")
+        
+        del lista[posicao]
+        self._sujo = max(self._sujo, indice_lista)
+
+    def limites_inferiores(self, valor_procurado):
+        """
+        Retorna, para cada lista, a quantidade de elementos menores que
+        valor_procurado (o índice base-0 onde ele seria inserido).
+        """
+        if self._sujo >= 0:
+            self._atualizar()
+        
+        quantidade = len(self.listas)
+        if quantidade == 0:
+            return []
+        
+        resultado = []
+        q = limite_inferior(self._mesclados[0], valor_procurado)
+        
+        for i in range(quantidade):
+            resultado.append(self._proprios[i][q])
+            
+            if i + 1 < quantidade:
+                # M_{i+1}[2c-1] < valor <= M_{i+1}[2c+1]: falta olhar só M_{i+1}[2c]
+                proximo = self._mesclados[i + 1]
+                q = 2 * self._pontes[i][q]
+                if q < len(proximo) and proximo[q] < valor_procurado:
+                    q += 1
+        
+        return resultado
+
+    def buscar(self, valor_procurado):
+        """
+        Busca o valor em todas as listas. Retorna uma lista com a posição
+        (base-1) da primeira ocorrência em cada lista, ou -1 onde ele não
+        for encontrado.
+        """
+        resultado = []
+        for lista, posicao in zip(self.listas, self.limites_inferiores(valor_procurado)):
+            if posicao < len(lista) and lista[posicao] == valor_procurado:
+                resultado.append(posicao + 1)
+            else:
+                resultado.append(-1)
+        return resultado
+
+
+def comparar_desempenho(quantidades=(10, 100, 1000), tamanho=1000, consultas=2000):
+    """
+    Compara K chamadas de busca_binaria com a cascata fracionária, para
+    K listas de tamanho elementos cada. Mede também o custo de reconstruir
+    a estrutura depois de inserções em uma lista do meio.
+    """
+    import random
+    import time
+    from binary_search import busca_binaria
+    
+    for quantidade in quantidades:
+        listas = [sorted(random.sample(range(tamanho * 10), tamanho)) for _ in range(quantidade)]
+        valores = [random.randrange(tamanho * 10) for _ in range(consultas)]
+        print(f"\n=== K = {quantidade} listas de {tamanho} elementos ===")
+        
+        inicio = time.perf_counter()
+        esperado = [[busca_binaria(lista, valor) for lista in listas] for valor in valores]
+        tempo_binaria = time.perf_counter() - inicio
+        print(f"  K × busca_binaria   {tempo_binaria / consultas * 1e6:9.1f} µs/consulta")
+        
+        inicio = time.perf_counter()
+        cascata = CascataFracionaria(listas)
+        tempo_construcao = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter()
+        obtido = [cascata.buscar(valor) for valor in valores]
+        tempo = time.perf_counter() - inicio
+        assert obtido == esperado
+        print(f"  cascata fracionária {tempo / consultas * 1e6:9.1f} µs/consulta"
+              f"  (construção {tempo_construcao:.3f} s, {tempo_binaria / tempo:.1f}x mais rápida)")
+        
+        # Inserções em uma lista do meio reconstroem só os níveis 0..K/2
+        for _ in range(10):
+            cascata.inserir(quantidade // 2, random.randrange(tamanho * 10))
+        cascata.niveis_reconstruidos = 0
+        inicio = time.perf_counter()
+        cascata.buscar(valores[0])
+        print(f"  10 inserções no nível {quantidade // 2}: {cascata.niveis_reconstruidos} níveis"
+              f" reconstruídos em {time.perf_counter() - inicio:.3f} s")
+
+
+def main():
+    """
+    Demonstra a cascata fracionária e compara o desempenho.
+    """
+    listas = [
+        [2, 9, 15, 24, 40],
+        [1, 5, 9, 30],
+        [9, 12, 18, 21, 33, 47],
+    ]
+    cascata = CascataFracionaria(listas)
+    
+    for i, lista in enumerate(cascata.listas):
+        print(f"L{i}: {lista}")
+    print("Posições de 9: ", cascata.buscar(9))
+    print("Posições de 20:", cascata.buscar(20))
+    
+    cascata.inserir(1, 20)
+    print("Depois de inserir 20 em L1:", cascata.buscar(20))
+    
+    comparar_desempenho()
+
+
+# Ponto de entrada do programa
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import sys
+
+
+class IndiceAprendido:
+    """
+    Índice "aprendido" para uma lista ordenada e estática de números,
+    no estilo PGM (Piecewise Geometric Model).
+    
+    A ideia: a posição de uma chave na lista ordenada é uma função
+    crescente da chave. Essa função é aproximada por segmentos de reta,
+    construídos de forma que a posição prevista nunca erre por mais de
+    erro_maximo. Uma busca então:
+        1. encontra o segmento da chave (busca binária nos segmentos,
+           que são bem menos numerosos que os dados);
+        2. calcula a posição prevista pela reta do segmento;
+        3. faz uma busca binária só na janela de 2 × erro_maximo posições
+           ao redor da previsão.
+    
+    Atributos:
+        dados (list): a lista ordenada indexada
+        erro_maximo (int): erro máximo da previsão, em posições
+        chaves_segmento (list): primeira chave de cada segmento
+        posicoes_segmento (list): posição dessa primeira chave na lista
+        inclinacoes (list): inclinação da reta de cada segmento
+    """
+
+    def __init__(self, dados, erro_maximo=32):
+        if erro_maximo < 1:
+            raise ValueError("erro_maximo deve ser positivo")
+        
+        self.dados = dados
+        self.erro_maximo = erro_maximo
+        self.chaves_segmento = []
+        self.posicoes_segmento = []
+        self.inclinacoes = []
+        self._construir()
+
+    def _construir(self):
+        """
+        Percorre a lista uma única vez criando os segmentos com o
+        algoritmo do "cone": cada ponto novo (chave, posição) restringe o
+        intervalo de inclinações [minima, maxima] que mantêm todos os
+        pontos do segmento dentro do erro. Quando o intervalo fica vazio,
+        o segmento é fechado e outro começa nesse ponto.
+        
+        Só a primeira ocorrência de cada chave é modelada: com valores
+        repetidos, a busca encontra sempre a primeira ocorrência.
+        """
+        erro = self.erro_maximo
+        chave_inicial = posicao_inicial = None
+        minima = maxima = None
+        
+        for posicao, chave in enumerate(self.dados):
+            # Repetições: apenas a primeira ocorrência é modelada
+            if posicao > 0 and chave == self.dados[posicao - 1]:
+                continue
+            
+            if chave_inicial is not None:
+                distancia = chave - chave_inicial
+                nova_minima = (posicao - erro - posicao_inicial) / distancia
+                nova_maxima = (posicao + erro - posicao_inicial) / distancia
+                if minima is not None:
+                    nova_minima = max(minima, nova_minima)
+                    nova_maxima = min(maxima, nova_maxima)
+                
+                # Ainda existe uma reta que atende a todos os pontos
+                if nova_minima <= nova_maxima:
+                    minima, maxima = nova_minima, nova_maxima
+                    continue
+                
+                # Não existe: fecha o segmento atual
+                self._fechar_segmento(minima, maxima)
+            
+            # Abre um novo segmento começando neste ponto
+            chave_inicial, posicao_inicial = chave, posicao
+            minima = maxima = None
+            self.chaves_segmento.append(chave)
+            self.posicoes_segmento.append(posicao)
+        
+        if chave_inicial is not None:
+            self._fechar_segmento(minima, maxima)
+
+    def _fechar_segmento(self, minima, maxima):
+        """Guarda a inclinação do segmento: o meio do intervalo permitido."""
+        if minima is None:
+            # Segmento com um único ponto: qualquer inclinação serve
+            self.inclinacoes.append(0.0)
+        else:
+            self.inclinacoes.append((minima + maxima) / 2)
+
+    def _segmento(self, chave):
+        """Retorna o índice do último segmento cuja chave inicial é <= chave."""
+        inicio = 0
+        fim = len(self.chaves_segmento) - 1
+        
+        while inicio < fim:
+            meio = (inicio + fim + 1) // 2
+            if self.chaves_segmento[meio] <= chave:
+                inicio = meio
+            else:
+                fim = meio - 1
+        
+        return inicio
+
+    def buscar(self, valor_procurado):
+        """
+        Busca um valor. Retorna a posição (base-1) da primeira ocorrência,
+        ou -1 caso ele não seja encontrado (mesma convenção de busca_binaria).
+        """
+        if not self.chaves_segmento or valor_procurado < self.chaves_segmento[0]:
+            return -1
+        
+        # Posição prevista pela reta do segmento
+        s = self._segmento(valor_procurado)
+        prevista = (self.posicoes_segmento[s]
+                    + self.inclinacoes[s] * (valor_procurado - self.chaves_segmento[s]))
+        
+        # Janela onde a primeira ocorrência certamente está (+1 para
+        # compensar arredondamentos de ponto flutuante)
+        inicio = max(int(prevista) - self.erro_maximo - 1, 0)
+        fim = min(int(prevista) + self.erro_maximo + 2, len(self.dados))
+        
+        # Busca binária do primeiro elemento >= valor dentro da janela
+        while inicio < fim:
+            meio = (inicio + fim) // 2
+            if self.dados[meio] < valor_procurado:
+                inicio = meio + 1
+            else:
+                fim = meio
+        
+        if inicio < len(self.dados) and self.dados[inicio] == valor_procurado:
+            return inicio + 1
+        return -1
+
+    def memoria_modelo(self):
+        """Bytes aproximados ocupados pelo modelo (sem contar os dados)."""
+        total = 0
+        for lista in (self.chaves_segmento, self.posicoes_segmento, self.inclinacoes):
+            total += sys.getsizeof(lista) + sum(sys.getsizeof(valor) for valor in lista)
+        return total
+
+
+def comparar_desempenho(tamanho=1000000, consultas=200000, erros=(8, 32, 128)):
+    """
+    Compara busca_binaria com o índice aprendido: tempo de construção,
+    memória do modelo e tempo médio por consulta.
+    """
+    import random
+    import time
+    from binary_search import busca_binaria
+    
+    # Chaves com distribuição suave (pontos de uma curva com ruído)
+    dados = sorted(set(int(i ** 1.5 + random.randint(0, 50)) for i in range(tamanho)))
+    valores = [random.choice(dados) if random.random() < 0.8 else random.randint(0, dados[-1])
+               for _ in range(consultas)]
+    print(f"{len(dados)} chaves, {consultas} consultas")
+    
+    inicio = time.perf_counter()
+    esperado = [busca_binaria(dados, valor) for valor in valores]
+    tempo = time.perf_counter() - inicio
+    print(f"  {'busca_binaria':<20} {'':>31} {tempo / consultas * 1e6:6.2f} µs/consulta")
+    
+    for erro in erros:
+        inicio = time.perf_counter()
+        indice = IndiceAprendido(dados, erro)
+        tempo_construcao = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter()
+        obtido = [indice.buscar(valor) for valor in valores]
+        tempo = time.perf_counter() - inicio
+        assert obtido == esperado
+        
+        print(f"  {'aprendido (erro ' + str(erro) + ')':<20} {len(indice.chaves_segmento):>7} segmentos"
+              f" {indice.memoria_modelo() / 1024:>8.1f} KiB {tempo_construcao:5.2f} s"
+              f" {tempo / consultas * 1e6:6.2f} µs/consulta")
+
+
+def main():
+    """
+    Demonstra o índice aprendido e compara com a busca binária.
+    """
+    dados = [3, 8, 12, 20, 22, 30, 41, 45, 50, 61]
+    indice = IndiceAprendido(dados, erro_maximo=1)
+    
+    print("Dados:", dados)
+    print("Segmentos (chave inicial, posição, inclinação):")
+    for segmento in zip(indice.chaves_segmento, indice.posicoes_segmento, indice.inclinacoes):
+        print("  ", segmento)
+    print("Posição de 45:", indice.buscar(45))
+    print("Posição de 46:", indice.buscar(46))
+    print()
+    
+    comparar_desempenho()
+
+
+# Ponto de entrada do programa
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,15 @@
+# NumPy é opcional: sem ele, apenas a versão em Python puro é usada
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def busca_sequencial(dados, valor_procurado):
+    # Vetores NumPy usam a versão vetorizada
+    if np is not None and isinstance(dados, np.ndarray):
+        return busca_sequencial_numpy(dados, valor_procurado)
+    
     achou = 0
     i = 0
     while (((i < len(dados))) and (achou == 0)):
@@ -12,6 +23,207 @@ def busca_sequencial(dados, valor_procurado):
     else:
         return i
 
+class IndiceHash:
+    """
+    Índice para muitas buscas sequenciais na mesma lista não ordenada.
+    
+    Uma única passada pela lista monta dois dicionários:
+        valor -> índice da primeira ocorrência
+        valor -> lista com todos os índices
+    e, a partir daí, cada busca custa O(1) em vez de O(n).
+    
+    O índice só é montado quando compensa: as primeiras consultas usam
+    busca_sequencial e, ao passar de limiar_consultas, o índice é
+    construído. Se a lista for alterada, chame invalidar(): o índice
+    será reconstruído, do mesmo modo, nas próximas consultas.
+    
+    Atributos:
+        dados (list): a lista indexada
+        limiar_consultas (int): consultas sequenciais antes de montar o índice
+        consultas (int): consultas feitas desde a última invalidação
+    """
+
+    def __init__(self, dados, limiar_consultas=4):
+        self.dados = dados
+        self.limiar_consultas = limiar_consultas
+        self.invalidar()
+
+    def invalidar(self):
+        """Descarta o índice (por exemplo, depois de alterar a lista)."""
+        self._primeira = None
+        self._todas = None
+        self._nao_hashaveis = []   # índices de elementos sem hash (ex.: listas)
+        self.consultas = 0
+
+    def construido(self):
+        """Retorna True se o índice já foi montado."""
+        return self._primeira is not None
+
+    def construir(self):
+        """Monta o índice com uma única passada pela lista."""
+        self._primeira = {}
+        self._todas = {}
+        self._nao_hashaveis = []
+        
+        for indice, valor in enumerate(self.dados):
+            try:
+                if valor not in self._primeira:
+                    self._primeira[valor] = indice
+                    self._todas[valor] = [indice]
+                else:
+                    self._todas[valor].append(indice)
+            except TypeError:
+                # Elementos sem hash não entram no dicionário
+                self._nao_hashaveis.append(indice)
+
+    def _usar_indice(self):
+        """Conta a consulta e decide se ela deve usar o índice."""
+        if not self.construido():
+            self.consultas += 1
+            if self.consultas <= self.limiar_consultas:
+                return False
+            self.construir()
+        return True
+
+    def buscar(self, valor_procurado):
+        """
+        Retorna o índice (base-0) da primeira ocorrência do valor, ou -1,
+        exatamente como busca_sequencial.
+        """
+        if not self._usar_indice():
+            return busca_sequencial(self.dados, valor_procurado)
+        
+        try:
+            posicao = self._primeira.get(valor_procurado, -1)
+        except TypeError:
+            # Valor procurado sem hash: só a busca sequencial resolve
+            return busca_sequencial(self.dados, valor_procurado)
+        
+        # Um elemento sem hash anterior também pode ser igual ao valor
+        for indice in self._nao_hashaveis:
+            if posicao != -1 and indice > posicao:
+                break
+            if self.dados[indice] == valor_procurado:
+                return indice
+        
+        return posicao
+
+    def todas_posicoes(self, valor_procurado):
+        """Retorna a lista, em ordem, de todos os índices do valor."""
+        if not self._usar_indice():
+            return [i for i, valor in enumerate(self.dados) if valor == valor_procurado]
+        
+        try:
+            posicoes = list(self._todas.get(valor_procurado, []))
+        except TypeError:
+            return [i for i, valor in enumerate(self.dados) if valor == valor_procurado]
+        
+        # Acrescenta os elementos sem hash iguais ao valor, mantendo a ordem
+        extras = [i for i in self._nao_hashaveis if self.dados[i] == valor_procurado]
+        if extras:
+            posicoes = sorted(posicoes + extras)
+        return posicoes
+
+
+def _criterio(valor_procurado, predicado):
+    """
+    Retorna a função que decide se um elemento corresponde à busca:
+    o predicado informado ou a comparação com valor_procurado.
+    """
+    if predicado is not None:
+        return predicado
+    return lambda elemento: elemento == valor_procurado
+
+
+def busca_sequencial_iteravel(iteravel, valor_procurado=None, predicado=None):
+    """
+    Busca sequencial em qualquer iterável (gerador, arquivo, etc.),
+    consumindo um elemento por vez, sem montar uma lista e sem usar len().
+    Retorna o índice (base-0) do primeiro elemento igual a valor_procurado
+    (ou para o qual predicado(elemento) é verdadeiro), ou -1.
+    
+    Usa memória constante, qualquer que seja o tamanho da entrada.
+    """
+    corresponde = _criterio(valor_procurado, predicado)
+    
+    for indice, elemento in enumerate(iteravel):
+        if corresponde(elemento):
+            return indice
+    
+    return -1
+
+
+def buscar_todos_iteravel(iteravel, valor_procurado=None, predicado=None):
+    """
+    Gerador que produz, em ordem, os índices (base-0) de todos os
+    elementos que correspondem à busca, à medida que o iterável é lido.
+    """
+    corresponde = _criterio(valor_procurado, predicado)
+    
+    for indice, elemento in enumerate(iteravel):
+        if corresponde(elemento):
+            yield indice
+
+
+def linhas_arquivo(caminho, encoding="utf-8"):
+    """
+    Gerador que lê um arquivo de texto linha a linha (sem a quebra de
+    linha final), para ser usado com as buscas em iteráveis.
+    """
+    with open(caminho, encoding=encoding) as arquivo:
+        for linha in arquivo:
+            yield linha.rstrip("\n")
+
+
+def busca_sequencial_numpy(dados, valor_procurado):
+    """
+    Busca sequencial vetorizada para vetores NumPy.
+    Compara todos os elementos de uma vez (máscara booleana) e usa
+    argmax para achar o primeiro True.
+    Retorna o índice da primeira ocorrência, ou -1 caso não exista,
+    como busca_sequencial.
+    """
+    if dados.ndim != 1:
+        raise ValueError("A busca só aceita vetores NumPy unidimensionais")
+    
+    mascara = dados == valor_procurado
+    if mascara.size == 0:
+        return -1
+    
+    # argmax devolve a posição do primeiro True (ou 0 se não houver nenhum)
+    indice = int(np.argmax(mascara))
+    if mascara[indice]:
+        return indice
+    return -1
+
+
+def busca_sequencial_numpy_lote(dados, valores):
+    """
+    Procura vários valores de uma vez em um vetor NumPy não ordenado.
+    Retorna um vetor NumPy com o índice da primeira ocorrência de cada
+    valor, ou -1 caso o valor não exista.
+    
+    np.unique ordena os valores distintos e informa onde cada um aparece
+    pela primeira vez; cada consulta vira então uma busca binária
+    (searchsorted) nesses valores distintos.
+    """
+    if dados.ndim != 1:
+        raise ValueError("A busca só aceita vetores NumPy unidimensionais")
+    
+    valores = np.asarray(valores)
+    if dados.size == 0:
+        return np.full(valores.shape, -1, dtype=np.int64)
+    
+    distintos, primeiras = np.unique(dados, return_index=True)
+    posicoes = np.searchsorted(distintos, valores)
+    
+    # Limita as posições para poder indexar e confere se o valor existe
+    limitadas = np.minimum(posicoes, distintos.size - 1)
+    encontrados = (posicoes < distintos.size) & (distintos[limitadas] == valores)
+    
+    return np.where(encontrados, primeiras[limitadas], -1).astype(np.int64)
+
+
 def main():
     """
     Gera uma lista aleatória e permite ao usuário buscar um valor.
@@ -0,0 +1,250 @@
+from binary_search import busca_binaria, contar_ocorrencias, limite_superior
+
+
+def _intercalar(esquerda, direita):
+    """
+    Intercala duas listas ordenadas em uma nova lista ordenada, com o
+    mesmo laço de intercalação do merge_sort (capitulo3).
+    """
+    resultado = [None] * (len(esquerda) + len(direita))
+    i = 0  # Índice para percorrer a lista esquerda
+    j = 0  # Índice para percorrer a lista direita
+    k = 0  # Índice para percorrer o resultado
+    
+    while i < len(esquerda) and j < len(direita):
+        if esquerda[i] < direita[j]:
+            resultado[k] = esquerda[i]
+            i += 1
+        else:
+            resultado[k] = direita[j]
+            j += 1
+        k += 1
+    
+    # Copia os elementos restantes de cada lista (se houver)
+    while i < len(esquerda):
+        resultado[k] = esquerda[i]
+        i += 1
+        k += 1
+    
+    while j < len(direita):
+        resultado[k] = direita[j]
+        j += 1
+        k += 1
+    
+    return resultado
+
+
+class ArmazenamentoLSM:
+    """
+    Conjunto ordenado (com repetições) que aceita inserções frequentes
+    sem reordenar tudo a cada escrita, no estilo LSM (Log-Structured
+    Merge tree):
+    
+    - as inserções vão para um buffer pequeno, mantido ordenado;
+    - quando o buffer atinge limite_buffer elementos, ele vira um
+      "run": uma lista ordenada imutável;
+    - os runs são intercalados por níveis de tamanho: um run novo só é
+      intercalado com o anterior quando fica pelo menos do tamanho dele
+      (ou quando há mais de max_runs runs), então cada elemento é copiado
+      só O(log n) vezes e o run grande não é recopiado a cada descarga;
+    - quando o run mais antigo (o maior) chega a razao_base × o tamanho
+      da base, ele é intercalado na base, a grande lista ordenada imutável.
+    
+    Uma busca faz uma busca binária no buffer, em cada run (do mais novo
+    ao mais antigo) e na base. Os limites controlam a troca entre custo
+    de escrita (intercalações mais frequentes) e de leitura (mais listas).
+    
+    Estatísticas:
+        inseridos (int): valores inseridos
+        elementos_gravados (int): elementos copiados para runs ou para a base
+        consultas (int): buscas feitas
+        listas_consultadas (int): listas examinadas por essas buscas
+    """
+
+    def __init__(self, dados=(), limite_buffer=1024, max_runs=4, razao_base=0.25):
+        if limite_buffer < 1:
+            raise ValueError("limite_buffer deve ser positivo")
+        if max_runs < 1:
+            raise ValueError("max_runs deve ser positivo")
+        if razao_base <= 0:
+            raise ValueError("razao_base deve ser positiva")
+        
+        self.limite_buffer = limite_buffer
+        self.max_runs = max_runs
+        self.razao_base = razao_base
+        
+        self.base = sorted(dados)
+        self.runs = []
+        self.buffer = []
+        self.zerar_estatisticas()
+
+    def zerar_estatisticas(self):
+        """Zera os contadores de amplificação."""
+        self.inseridos = 0
+        self.elementos_gravados = 0
+        self.consultas = 0
+        self.listas_consultadas = 0
+
+    def __len__(self):
+        return len(self.base) + sum(len(run) for run in self.runs) + len(self.buffer)
+
+    def inserir(self, valor):
+        """Insere um valor. Pode disparar a gravação do buffer e intercalações."""
+        self.buffer.insert(limite_superior(self.buffer, valor), valor)
+        self.inseridos += 1
+        
+        if len(self.buffer) >= self.limite_buffer:
+            self.descarregar()
+
+    def descarregar(self):
+        """Transforma o buffer em um novo run e intercala os runs, se necessário."""
+        if not self.buffer:
+            return
+        
+        self.runs.append(self.buffer)
+        self.elementos_gravados += len(self.buffer)
+        self.buffer = []
+        self._compactar_runs()
+
+    def _compactar_runs(self):
+        """
+        Compactação por níveis. Os runs ficam do mais antigo (maior) ao
+        mais novo (menor); enquanto o mais novo for pelo menos do tamanho
+        do anterior, ou houver runs demais, os dois mais novos são
+        intercalados. O run mais antigo só é copiado de novo quando outro
+        run do mesmo tamanho o alcança, ou quando vai para a base.
+        """
+        runs = self.runs
+        while len(runs) > 1 and (len(runs[-1]) >= len(runs[-2]) or len(runs) > self.max_runs):
+            novo = _intercalar(runs[-2], runs[-1])
+            self.elementos_gravados += len(novo)
+            runs[-2:] = [novo]
+        
+        if runs and len(runs[0]) >= self.razao_base * len(self.base):
+            self.base = _intercalar(self.base, runs[0])
+            self.elementos_gravados += len(self.base)
+            del runs[0]
+
+    def compactar(self):
+        """Intercala o buffer e todos os runs na base."""
+        self.descarregar()
+        for run in self.runs:
+            self.base = _intercalar(self.base, run)
+            self.elementos_gravados += len(self.base)
+        self.runs = []
+
+    def _listas(self):
+        """Listas ordenadas a consultar, da mais nova para a mais antiga."""
+        return [self.buffer] + self.runs[::-1] + [self.base]
+
+    def contem(self, valor):
+        """Retorna True se o valor estiver armazenado."""
+        self.consultas += 1
+        
+        for lista in self._listas():
+            if lista:
+                self.listas_consultadas += 1
+                if busca_binaria(lista, valor) != -1:
+                    return True
+        return False
+
+    def contar(self, valor):
+        """Retorna quantas vezes o valor está armazenado."""
+        self.consultas += 1
+        
+        total = 0
+        for lista in self._listas():
+            if lista:
+                self.listas_consultadas += 1
+                total += contar_ocorrencias(lista, valor)
+        return total
+
+    def ordenados(self):
+        """Retorna uma nova lista ordenada com todos os valores."""
+        resultado = self.base[:]
+        for lista in self.runs + [self.buffer]:
+            resultado = _intercalar(resultado, lista)
+        return resultado
+
+    def estatisticas(self):
+        """
+        Retorna as amplificações de escrita (elementos gravados por valor
+        inserido) e de leitura (listas examinadas por busca).
+        """
+        return {
+            "runs": len(self.runs),
+            "tamanho_base": len(self.base),
+            "amplificacao_escrita": self.elementos_gravados / self.inseridos if self.inseridos else 0.0,
+            "amplificacao_leitura": self.listas_consultadas / self.consultas if self.consultas else 0.0,
+        }
+
+
+def comparar_desempenho(tamanho_base=200000, operacoes=20000):
+    """
+    Intercala inserções e buscas sobre uma base grande e compara o
+    armazenamento LSM (com vários limites) com manter uma única lista,
+    reordenando-a após cada inserção.
+    """
+    import random
+    import time
+    
+    base = random.sample(range(tamanho_base * 10), tamanho_base)
+    valores = [random.randrange(tamanho_base * 10) for _ in range(operacoes)]
+    # Metade das buscas procura valores da base, metade valores quaisquer
+    procurados = [random.choice(base) if i % 2 else random.randrange(tamanho_base * 10)
+                  for i in range(operacoes)]
+    
+    # Lista única reordenada a cada escrita: poucas operações bastam
+    amostra = operacoes // 20
+    lista = sorted(base)
+    inicio = time.perf_counter()
+    for valor, procurado in zip(valores[:amostra], procurados):
+        lista.append(valor)
+        lista.sort()
+        busca_binaria(lista, procurado)
+    tempo = time.perf_counter() - inicio
+    print(f"  {'reordenar a cada escrita':<34} {tempo / amostra * 1e6:8.1f} µs/operação")
+    
+    # Com poucos runs permitidos (64, 2), runs de tamanhos diferentes são
+    # intercalados à força: menos listas por busca, mais cópias por escrita
+    for limite_buffer, max_runs in ((64, 2), (64, 8), (1024, 4), (4096, 8)):
+        armazenamento = ArmazenamentoLSM(base, limite_buffer, max_runs)
+        inicio = time.perf_counter()
+        for valor, procurado in zip(valores, procurados):
+            armazenamento.inserir(valor)
+            armazenamento.contem(procurado)
+        tempo = time.perf_counter() - inicio
+        
+        estatisticas = armazenamento.estatisticas()
+        print(f"  {'LSM (buffer ' + str(limite_buffer) + ', ' + str(max_runs) + ' runs)':<34}"
+              f" {tempo / operacoes * 1e6:8.1f} µs/operação"
+              f"  escrita {estatisticas['amplificacao_escrita']:5.1f}x"
+              f"  leitura {estatisticas['amplificacao_leitura']:4.1f} listas/busca")
+    
+    assert armazenamento.ordenados() == sorted(base + valores)
+
+
+def main():
+    """
+    Demonstra o armazenamento LSM e compara o desempenho.
+    """
+    armazenamento = ArmazenamentoLSM([10, 20, 30, 40, 50], limite_buffer=2, max_runs=2,
+                                     razao_base=1)
+    for valor in [35, 5, 45, 25, 15, 35]:
+        armazenamento.inserir(valor)
+        print(f"Inseriu {valor:>2}: base={armazenamento.base} runs={armazenamento.runs}"
+              f" buffer={armazenamento.buffer}")
+    
+    print("Contém 25?", armazenamento.contem(25))
+    print("Contém 26?", armazenamento.contem(26))
+    print("Ocorrências de 35:", armazenamento.contar(35))
+    print("Todos os valores:", armazenamento.ordenados())
+    print("Estatísticas:", armazenamento.estatisticas())
+    
+    print("\n=== Inserções e buscas intercaladas (base de 200000 valores) ===\n")
+    comparar_desempenho()
+
+
+# Ponto de entrada do programa
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+import mmap
+import struct
+
+
+class BuscaArquivoMapeado:
+    """
+    Busca binária direto em um arquivo de registros de tamanho fixo,
+    ordenados pela chave, sem carregar o arquivo em uma lista.
+    
+    O arquivo é mapeado na memória (mmap): o sistema operacional só lê
+    do disco as páginas realmente acessadas pela busca. As chaves são
+    lidas do buffer mapeado com struct.unpack_from, sem cópias.
+    
+    Atributos:
+        formato_chave (str): formato struct da chave (ex.: ">Q" para um
+                             inteiro de 8 bytes big-endian)
+        tamanho_registro (int): tamanho de cada registro em bytes
+        deslocamento_chave (int): posição da chave dentro do registro
+        quantidade (int): número de registros no arquivo
+        acessos_pagina (int): páginas acessadas (com repetição)
+        paginas_distintas (set): páginas diferentes acessadas
+    """
+
+    def __init__(self, caminho, formato_chave=">Q", tamanho_registro=None,
+                 deslocamento_chave=0):
+        self.formato_chave = formato_chave
+        tamanho_chave = struct.calcsize(formato_chave)
+        self.tamanho_registro = tamanho_registro or tamanho_chave
+        self.deslocamento_chave = deslocamento_chave
+        
+        if deslocamento_chave + tamanho_chave > self.tamanho_registro:
+            raise ValueError("A chave não cabe dentro do registro")
+        
+        self._arquivo = open(caminho, "rb")
+        tamanho_arquivo = self._arquivo.seek(0, 2)
+        
+        if tamanho_arquivo % self.tamanho_registro != 0:
+            self._arquivo.close()
+            raise ValueError("O tamanho do arquivo não é múltiplo do tamanho do registro")
+        
+        self.quantidade = tamanho_arquivo // self.tamanho_registro
+        
+        # Arquivos vazios não podem ser mapeados
+        self._mapa = None
+        self._buffer = memoryview(b"")
+        if tamanho_arquivo > 0:
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buffer = memoryview(self._mapa)
+        
+        self.zerar_contadores()
+
+    def zerar_contadores(self):
+        """Zera a contagem de páginas acessadas."""
+        self.acessos_pagina = 0
+        self.paginas_distintas = set()
+
+    def _chave(self, indice):
+        """Lê a chave do registro de índice (base-0) e registra a página."""
+        deslocamento = indice * self.tamanho_registro + self.deslocamento_chave
+        
+        pagina = deslocamento // mmap.PAGESIZE
+        self.acessos_pagina += 1
+        self.paginas_distintas.add(pagina)
+        
+        return struct.unpack_from(self.formato_chave, self._buffer, deslocamento)[0]
+
+    def _buscar_intervalo(self, chave, inicio, fim):
+        """
+        Busca binária entre os registros inicio e fim (base-0).
+        Retorna (posicao, limite): posicao é a posição base-1 da chave
+        (ou -1) e nenhum registro antes de limite tem chave maior que ela.
+        """
+        while inicio <= fim:
+            meio = (inicio + fim) // 2
+            chave_meio = self._chave(meio)
+            
+            if chave_meio == chave:
+                return meio + 1, meio
+            elif chave_meio < chave:
+                inicio = meio + 1
+            else:
+                fim = meio - 1
+        
+        return -1, inicio
+
+    def buscar(self, chave):
+        """
+        Busca uma chave. Retorna a posição (base-1) do registro, ou -1
+        caso ela não seja encontrada.
+        """
+        return self._buscar_intervalo(chave, 0, self.quantidade - 1)[0]
+
+    def buscar_lote(self, chaves):
+        """
+        Busca várias chaves. Retorna a lista de posições (base-1, ou -1)
+        na mesma ordem das chaves consultadas.
+        
+        As chaves são processadas em ordem crescente: cada busca começa
+        de onde a anterior parou, o que evita reler as páginas iniciais.
+        """
+        chaves = list(chaves)
+        resultado = [-1] * len(chaves)
+        ordem = sorted(range(len(chaves)), key=lambda i: chaves[i])
+        
+        inicio = 0
+        for i in ordem:
+            posicao, limite = self._buscar_intervalo(chaves[i], inicio, self.quantidade - 1)
+            resultado[i] = posicao
+            inicio = limite
+        
+        return resultado
+
+    def ler_registro(self, posicao):
+        """Retorna os bytes do registro na posição (base-1) informada."""
+        if not 1 <= posicao <= self.quantidade:
+            raise IndexError("Posição fora do arquivo")
+        
+        inicio = (posicao - 1) * self.tamanho_registro
+        return bytes(self._buffer[inicio:inicio + self.tamanho_registro])
+
+    def fechar(self):
+        """Libera o mapeamento e fecha o arquivo."""
+        self._buffer.release()
+        if self._mapa is not None:
+            self._mapa.close()
+        self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+def main():
+    """
+    Cria um arquivo temporário de registros ordenados e faz buscas nele.
+    """
+    import os
+    import random
+    import tempfile
+    
+    # Registro de 16 bytes: chave (inteiro de 8 bytes) + dado (inteiro de 8 bytes)
+    formato_registro = struct.Struct(">QQ")
+    quantidade = 1000000
+    chaves = sorted(random.sample(range(quantidade * 10), quantidade))
+    
+    descritor, caminho = tempfile.mkstemp(suffix=".dat")
+    with os.fdopen(descritor, "wb") as arquivo:
+        for chave in chaves:
+            arquivo.write(formato_registro.pack(chave, chave * 2))
+    
+    try:
+        with BuscaArquivoMapeado(caminho, ">Q", formato_registro.size) as busca:
+            print(f"Arquivo com {busca.quantidade} registros de {busca.tamanho_registro} bytes")
+            
+            chave = chaves[123456]
+            posicao = busca.buscar(chave)
+            print(f"\nChave {chave} encontrada na posição {posicao}")
+            print(f"Registro: {formato_registro.unpack(busca.ler_registro(posicao))}")
+            print(f"Páginas acessadas: {busca.acessos_pagina}")
+            
+            consultas = random.sample(chaves, 10000) + [-1, quantidade * 10]
+            busca.zerar_contadores()
+            individuais = [busca.buscar(chave) for chave in consultas]
+            print(f"\n{len(consultas)} buscas individuais: {busca.acessos_pagina} acessos, "
+                  f"{len(busca.paginas_distintas)} páginas distintas")
+            
+            busca.zerar_contadores()
+            lote = busca.buscar_lote(consultas)
+            print(f"{len(consultas)} buscas em lote:       {busca.acessos_pagina} acessos, "
+                  f"{len(busca.paginas_distintas)} páginas distintas")
+            
+            assert individuais == lote
+    finally:
+        os.remove(caminho)
+
+
+# Ponto de entrada do programa
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+import multiprocessing
+import os
+from array import array
+from multiprocessing import shared_memory
+
+# NumPy é opcional: sem ele, vetores do módulo array e listas continuam funcionando
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Estado de cada processo trabalhador, preenchido por _inicializar
+_trabalhador = {}
+
+
+def _inicializar(melhor, nome_memoria, tipo, n):
+    """
+    Executada uma vez em cada processo trabalhador: guarda o índice
+    compartilhado do melhor resultado e, para dados numéricos, conecta-se
+    à memória compartilhada que contém o vetor (como memoryview, para
+    códigos de tipo do módulo array, ou como vetor NumPy, para um dtype).
+    """
+    _trabalhador["melhor"] = melhor
+    _trabalhador["dados"] = None
+    
+    if nome_memoria is not None:
+        memoria = shared_memory.SharedMemory(name=nome_memoria)
+        _trabalhador["memoria"] = memoria
+        if isinstance(tipo, str):
+            _trabalhador["dados"] = memoria.buf.cast(tipo)
+        else:
+            _trabalhador["dados"] = np.ndarray((n,), dtype=tipo, buffer=memoria.buf)
+
+
+def _trecho(inicio, fim, bloco, deslocamento):
+    """
+    Retorna os elementos inicio..fim-1: da memória compartilhada ou do
+    bloco recebido (que começa no índice deslocamento). Vetores NumPy são
+    devolvidos como visões, sem cópia; memoryviews viram listas.
+    """
+    dados = _trabalhador["dados"]
+    if dados is None:
+        return bloco[inicio - deslocamento:fim - deslocamento]
+    if isinstance(dados, memoryview):
+        return dados[inicio:fim].tolist()
+    return dados[inicio:fim]
+
+
+def _posicoes(trecho, valor_procurado, apenas_primeira):
+    """
+    Retorna os índices (dentro do trecho) onde o valor aparece, ou só o
+    primeiro se apenas_primeira. Vetores NumPy são comparados de uma vez
+    com uma máscara; listas e vetores do módulo array usam index().
+    """
+    if np is not None and isinstance(trecho, np.ndarray):
+        if trecho.ndim != 1:
+            raise ValueError("A busca só aceita vetores NumPy unidimensionais")
+        indices = np.flatnonzero(trecho == valor_procurado)
+        if apenas_primeira:
+            indices = indices[:1]
+        return indices.tolist()
+    
+    indices = []
+    posicao = -1
+    while True:
+        try:
+            posicao = trecho.index(valor_procurado, posicao + 1)
+        except ValueError:
+            break
+        indices.append(posicao)
+        if apenas_primeira:
+            break
+    return indices
+
+
+def _procurar_primeiro(tarefa):
+    """
+    Procura a primeira ocorrência do valor no intervalo [inicio, fim),
+    em sub-blocos. Antes de cada sub-bloco consulta o melhor índice já
+    encontrado por qualquer processo: se ele for menor que o sub-bloco,
+    nada aqui pode melhorar o resultado e a busca é interrompida.
+    """
+    inicio, fim, valor_procurado, bloco, tamanho_sub_bloco = tarefa
+    melhor = _trabalhador["melhor"]
+    
+    for sub_inicio in range(inicio, fim, tamanho_sub_bloco):
+        atual = melhor.value
+        if atual != -1 and atual < sub_inicio:
+            return -1  # cancelado: já existe uma ocorrência anterior
+        
+        sub_fim = min(sub_inicio + tamanho_sub_bloco, fim)
+        trecho = _trecho(sub_inicio, sub_fim, bloco, inicio)
+        encontrados = _posicoes(trecho, valor_procurado, True)
+        if not encontrados:
+            continue
+        indice = sub_inicio + encontrados[0]
+        
+        # Publica o resultado se for o menor índice conhecido
+        with melhor.get_lock():
+            if melhor.value == -1 or indice < melhor.value:
+                melhor.value = indice
+        return indice
+    
+    return -1
+
+
+def _procurar_todos(tarefa):
+    """Retorna, em ordem, todos os índices do valor no intervalo [inicio, fim)."""
+    inicio, fim, valor_procurado, bloco, tamanho_sub_bloco = tarefa
+    indices = []
+    
+    for sub_inicio in range(inicio, fim, tamanho_sub_bloco):
+        sub_fim = min(sub_inicio + tamanho_sub_bloco, fim)
+        trecho = _trecho(sub_inicio, sub_fim, bloco, inicio)
+        for posicao in _posicoes(trecho, valor_procurado, False):
+            indices.append(sub_inicio + posicao)
+    
+    return indices
+
+
+def _tipo_numerico(dados):
+    """
+    Retorna o tipo dos dados numéricos na memória compartilhada: o dtype,
+    para vetores NumPy, ou o código de tipo do módulo array ("q" para
+    inteiros de 64 bits, "d" para floats). Retorna None se os dados não
+    puderem ir para a memória compartilhada.
+    """
+    if np is not None and isinstance(dados, np.ndarray):
+        if dados.ndim != 1:
+            raise ValueError("A busca só aceita vetores NumPy unidimensionais")
+        return None if dados.dtype.hasobject else dados.dtype
+    if isinstance(dados, array):
+        # memoryview.cast não aceita os códigos de caracteres Unicode
+        return None if dados.typecode in ("u", "w") else dados.typecode
+    if all(type(valor) is int and -2 ** 63 <= valor < 2 ** 63 for valor in dados):
+        return "q"
+    if all(type(valor) is float for valor in dados):
+        return "d"
+    return None
+
+
+def _executar(funcao, dados, valor_procurado, processos, tamanho_sub_bloco):
+    """
+    Divide os dados em blocos, um conjunto por processo, e executa a
+    função em um Pool. Dados numéricos são copiados uma única vez para
+    a memória compartilhada; os demais são enviados bloco a bloco.
+    Retorna os resultados na ordem dos blocos.
+    """
+    n = len(dados)
+    processos = processos or os.cpu_count() or 1
+    quantidade_blocos = processos * 4
+    tamanho_bloco = max(-(-n // quantidade_blocos), 1)
+    
+    tipo = _tipo_numerico(dados)
+    memoria = None
+    if isinstance(tipo, str):
+        vetor = dados if isinstance(dados, array) else array(tipo, dados)
+        memoria = shared_memory.SharedMemory(create=True, size=max(len(vetor) * vetor.itemsize, 1))
+        visao = memoria.buf.cast(tipo)
+        visao[:n] = vetor
+        visao.release()
+    elif tipo is not None:
+        memoria = shared_memory.SharedMemory(create=True, size=max(dados.nbytes, 1))
+        visao = np.ndarray((n,), dtype=tipo, buffer=memoria.buf)
+        visao[:] = dados
+        del visao
+    
+    tarefas = []
+    for inicio in range(0, n, tamanho_bloco):
+        fim = min(inicio + tamanho_bloco, n)
+        bloco = None if memoria is not None else dados[inicio:fim]
+        tarefas.append((inicio, fim, valor_procurado, bloco, tamanho_sub_bloco))
+    
+    melhor = multiprocessing.Value("q", -1)
+    nome_memoria = memoria.name if memoria is not None else None
+    
+    try:
+        with multiprocessing.Pool(processos, _inicializar, (melhor, nome_memoria, tipo, n)) as pool:
+            return pool.map(funcao, tarefas, chunksize=1)
+    finally:
+        if memoria is not None:
+            memoria.close()
+            memoria.unlink()
+
+
+def busca_sequencial_paralela(dados, valor_procurado, processos=None,
+                              tamanho_sub_bloco=100000, n_minimo=1000000):
+    """
+    Busca sequencial dividida entre vários processos.
+    Retorna o índice da primeira ocorrência do valor (exatamente como
+    busca_sequencial), ou -1 caso ele não exista.
+    
+    Assim que algum processo encontra o valor, os processos que estão
+    analisando trechos posteriores param; os trechos anteriores continuam,
+    pois podem conter uma ocorrência com índice menor.
+    
+    Parâmetros:
+        processos: quantidade de processos (None = número de CPUs)
+        tamanho_sub_bloco: elementos analisados entre as verificações de
+                           cancelamento
+        n_minimo: abaixo desse tamanho a busca é feita sem processos
+    """
+    # Listas pequenas: o custo de criar processos não compensa
+    if len(dados) < n_minimo:
+        encontrados = _posicoes(dados, valor_procurado, True)
+        return encontrados[0] if encontrados else -1
+    
+    resultados = _executar(_procurar_primeiro, dados, valor_procurado,
+                           processos, tamanho_sub_bloco)
+    
+    encontrados = [indice for indice in resultados if indice != -1]
+    return min(encontrados) if encontrados else -1
+
+
+def buscar_todos_paralelo(dados, valor_procurado, processos=None,
+                          tamanho_sub_bloco=100000, n_minimo=1000000):
+    """
+    Retorna a lista, em ordem crescente, de todos os índices onde o valor
+    aparece. Cada processo analisa seus blocos e os resultados são
+    concatenados na ordem dos blocos.
+    """
+    if len(dados) < n_minimo:
+        return _posicoes(dados, valor_procurado, False)
+    
+    resultados = _executar(_procurar_todos, dados, valor_procurado,
+                           processos, tamanho_sub_bloco)
+    
+    indices = []
+    for parcial in resultados:
+        indices.extend(parcial)
+    return indices
+
+
+def main():
+    """
+    Compara busca_sequencial com a versão paralela em um vetor numérico.
+    """
+    import random
+    import time
+    from linear_search import busca_sequencial
+    
+    n = 5000000
+    # Vetores do módulo array vão direto para a memória compartilhada
+    dados = array("q", (random.randrange(n) for _ in range(n)))
+    valor_procurado = dados[n // 3]
+    print(f"{n} elementos, procurando {valor_procurado}")
+    
+    inicio = time.perf_counter()
+    esperado = busca_sequencial(dados, valor_procurado)
+    print(f"busca_sequencial:          índice {esperado} em {time.perf_counter() - inicio:.3f} s")
+    
+    for processos in (1, 2, 4):
+        inicio = time.perf_counter()
+        obtido = busca_sequencial_paralela(dados, valor_procurado, processos)
+        tempo = time.perf_counter() - inicio
+        assert obtido == esperado
+        print(f"Paralela ({processos} processos):    índice {obtido} em {tempo:.3f} s")
+    
+    inicio = time.perf_counter()
+    todos = buscar_todos_paralelo(dados, valor_procurado)
+    print(f"\nTodas as ocorrências: {todos} em {time.perf_counter() - inicio:.3f} s")
+
+
+# Ponto de entrada do programa
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+def _galopar(dados, valor_procurado, inicio):
+    """
+    Retorna o primeiro índice i >= inicio com dados[i] >= valor_procurado
+    (ou len(dados)). Dobra o passo até passar do valor e depois faz uma
+    busca binária só nesse último intervalo: O(log d), onde d é a
+    distância percorrida.
+    """
+    n = len(dados)
+    fim = inicio
+    passo = 1
+    
+    # Todos os elementos antes de inicio são menores que o valor
+    while fim < n and dados[fim] < valor_procurado:
+        inicio = fim + 1
+        fim += passo
+        passo *= 2
+    fim = min(fim, n)
+    
+    # Busca binária do primeiro elemento >= valor em [inicio, fim]
+    while inicio < fim:
+        meio = (inicio + fim) // 2
+        if dados[meio] < valor_procurado:
+            inicio = meio + 1
+        else:
+            fim = meio
+    
+    return inicio
+
+
+def _usar_galope(menor, maior, razao_galope):
+    """Decide se vale galopar na lista maior em vez de intercalar."""
+    return len(maior) >= razao_galope * max(len(menor), 1)
+
+
+def intersecao_ordenada(a, b, razao_galope=8):
+    """
+    Retorna uma lista ordenada com os elementos presentes em a e em b
+    (listas ordenadas sem repetição, como listas de IDs).
+    
+    Com tamanhos parecidos, intercala as listas em O(m + n). Quando uma
+    é pelo menos razao_galope vezes maior, cada elemento da menor é
+    procurado na maior com busca galopante a partir da posição anterior,
+    em O(m log(n / m)).
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    resultado = []
+    
+    if _usar_galope(a, b, razao_galope):
+        j = 0
+        for valor in a:
+            j = _galopar(b, valor, j)
+            if j == len(b):
+                break
+            if b[j] == valor:
+                resultado.append(valor)
+                j += 1
+        return resultado
+    
+    # Intercalação linear
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]:
+            i += 1
+        elif b[j] < a[i]:
+            j += 1
+        else:
+            resultado.append(a[i])
+            i += 1
+            j += 1
+    return resultado
+
+
+def uniao_ordenada(a, b, razao_galope=8):
+    """
+    Retorna uma lista ordenada com os elementos presentes em a ou em b.
+    Com galope, os trechos da lista maior entre dois elementos da menor
+    são copiados de uma vez (fatiamento), sem comparar elemento a elemento.
+    """
+    menor, maior = (a, b) if len(a) <= len(b) else (b, a)
+    resultado = []
+    
+    if _usar_galope(menor, maior, razao_galope):
+        j = 0
+        for valor in menor:
+            k = _galopar(maior, valor, j)
+            resultado.extend(maior[j:k])
+            # Se o valor também está na maior, ele entra no próximo trecho
+            if k == len(maior) or maior[k] != valor:
+                resultado.append(valor)
+            j = k
+        resultado.extend(maior[j:])
+        return resultado
+    
+    # Intercalação linear
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]:
+            resultado.append(a[i])
+            i += 1
+        elif b[j] < a[i]:
+            resultado.append(b[j])
+            j += 1
+        else:
+            resultado.append(a[i])
+            i += 1
+            j += 1
+    resultado.extend(a[i:])
+    resultado.extend(b[j:])
+    return resultado
+
+
+def diferenca_ordenada(a, b, razao_galope=8):
+    """
+    Retorna uma lista ordenada com os elementos de a que não estão em b.
+    """
+    resultado = []
+    
+    if _usar_galope(b, a, razao_galope):
+        # b pequena: localiza cada elemento de b em a e copia os trechos entre eles
+        i = 0
+        for valor in b:
+            k = _galopar(a, valor, i)
+            resultado.extend(a[i:k])
+            i = k + 1 if k < len(a) and a[k] == valor else k
+        resultado.extend(a[i:])
+        return resultado
+    
+    if _usar_galope(a, b, razao_galope):
+        # a pequena: procura cada elemento de a em b
+        j = 0
+        for valor in a:
+            j = _galopar(b, valor, j)
+            if j == len(b) or b[j] != valor:
+                resultado.append(valor)
+        return resultado
+    
+    # Intercalação linear
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]:
+            resultado.append(a[i])
+            i += 1
+        elif b[j] < a[i]:
+            j += 1
+        else:
+            i += 1
+            j += 1
+    resultado.extend(a[i:])
+    return resultado
+
+
+def intersecao_k_listas(listas, razao_galope=8):
+    """
+    Retorna a interseção de várias listas ordenadas. Começa pela menor e
+    intersecta com as demais em ordem crescente de tamanho: o resultado
+    parcial só diminui, então as etapas seguintes tendem a galopar.
+    """
+    if not listas:
+        return []
+    
+    ordenadas = sorted(listas, key=len)
+    resultado = list(ordenadas[0])
+    for lista in ordenadas[1:]:
+        if not resultado:
+            break
+        resultado = intersecao_ordenada(resultado, lista, razao_galope)
+    return resultado
+
+
+def comparar_desempenho(tamanho_maior=1000000, tamanhos_menor=(100, 10000, 100000, 1000000)):
+    """
+    Compara, para vários desequilíbrios de tamanho, a interseção com
+    busca_binaria por elemento, a intercalação linear e a versão
+    adaptativa (que galopa quando a razão entre os tamanhos é grande).
+    """
+    import random
+    import time
+    from binary_search import busca_binaria
+    
+    universo = tamanho_maior * 4
+    maior = sorted(random.sample(range(universo), tamanho_maior))
+    
+    for tamanho_menor in tamanhos_menor:
+        menor = sorted(random.sample(range(universo), tamanho_menor))
+        print(f"\n=== {tamanho_menor} x {tamanho_maior} elementos ===")
+        
+        inicio = time.perf_counter()
+        esperado = [valor for valor in menor if busca_binaria(maior, valor) != -1]
+        print(f"  {'busca_binaria por elemento':<34} {time.perf_counter() - inicio:8.4f} s")
+        
+        estrategias = (
+            ("intercalação linear", float("inf")),
+            ("galope", 1),
+            ("adaptativa", 8),
+        )
+        for nome, razao_galope in estrategias:
+            inicio = time.perf_counter()
+            obtido = intersecao_ordenada(menor, maior, razao_galope)
+            tempo = time.perf_counter() - inicio
+            assert obtido == esperado
+            print(f"  {'interseção (' + nome + ')':<34} {tempo:8.4f} s")
+        
+        inicio = time.perf_counter()
+        uniao = uniao_ordenada(menor, maior)
+        diferenca = diferenca_ordenada(maior, menor)
+        tempo = time.perf_counter() - inicio
+        assert len(uniao) == len(diferenca) + len(menor)
+        print(f"  {'união + diferença (adapt.)':<34} {tempo:8.4f} s")
+
+
+def main():
+    """
+    Demonstra as operações e compara o desempenho.
+    """
+    a = [1, 3, 5, 7, 9, 11]
+    b = [2, 3, 5, 8, 11, 13, 21]
+    c = [3, 4, 5, 11, 50]
+    
+    print("a =", a)
+    print("b =", b)
+    print("c =", c)
+    print("a ∩ b     =", intersecao_ordenada(a, b))
+    print("a ∪ b     =", uniao_ordenada(a, b))
+    print("a - b     =", diferenca_ordenada(a, b))
+    print("a ∩ b ∩ c =", intersecao_k_listas([a, b, c]))
+    
+    comparar_desempenho()
+
+
+# Ponto de entrada do programa
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,508 @@ def merge_sort(dados):
             j += 1
             k += 1
 
+def merge_sort_pilha(dados):
+    """
+    Versão do Merge Sort que troca a recursão por uma pilha explícita.
+    Faz as mesmas divisões e as mesmas intercalações de merge_sort(),
+    portanto produz exatamente o mesmo resultado, sem depender do
+    limite de recursão do Python.
+    
+    Cada item da pilha é (inicio, fim, intercalar): o trecho dados[inicio:fim]
+    e se ele ainda precisa ser dividido ou se já pode ser intercalado.
+    """
+    pilha = [(0, len(dados), False)]
+    
+    while pilha:
+        inicio, fim, intercalar = pilha.pop()
+        
+        # Trechos com 1 ou 0 elementos já estão ordenados
+        if fim - inicio <= 1:
+            continue
+        
+        meio = inicio + (fim - inicio) // 2
+        
+        if not intercalar:
+            # Agenda a intercalação para depois que as metades forem ordenadas
+            pilha.append((inicio, fim, True))
+            pilha.append((meio, fim, False))
+            pilha.append((inicio, meio, False))
+            continue
+        
+        # Intercala as duas metades ordenadas (mesma regra de merge_sort)
+        esquerda = dados[inicio:meio]
+        direita = dados[meio:fim]
+        i = 0
+        j = 0
+        k = inicio
+        
+        while i < len(esquerda) and j < len(direita):
+            if esquerda[i] < direita[j]:
+                dados[k] = esquerda[i]
+                i += 1
+            else:
+                dados[k] = direita[j]
+                j += 1
+            k += 1
+        
+        # Copia os elementos restantes de cada metade (se houver)
+        while i < len(esquerda):
+            dados[k] = esquerda[i]
+            i += 1
+            k += 1
+        
+        while j < len(direita):
+            dados[k] = direita[j]
+            j += 1
+            k += 1
+
+
+def merge_sort_bottom_up(dados):
+    """
+    Versão iterativa "de baixo para cima" do Merge Sort.
+    Em vez de dividir a lista recursivamente (criando duas fatias novas
+    a cada chamada), intercala trechos de tamanho 1, 2, 4, 8, ... até
+    cobrir a lista inteira.
+    
+    Só é criada uma lista auxiliar, do tamanho dos dados: a cada passada
+    os trechos são intercalados da lista de origem para a de destino, e
+    as duas trocam de papel na passada seguinte. A comparação usa <=,
+    portanto a ordenação é estável.
+    """
+    n = len(dados)
+    if n <= 1:
+        return
+    
+    origem = dados
+    destino = [None] * n  # Único buffer auxiliar
+    largura = 1
+    
+    while largura < n:
+        # Intercala os pares de trechos origem[inicio:meio] e origem[meio:fim]
+        for inicio in range(0, n, 2 * largura):
+            meio = min(inicio + largura, n)
+            fim = min(inicio + 2 * largura, n)
+            i = inicio
+            j = meio
+            k = inicio
+            
+            while i < meio and j < fim:
+                if origem[i] <= origem[j]:
+                    destino[k] = origem[i]
+                    i += 1
+                else:
+                    destino[k] = origem[j]
+                    j += 1
+                k += 1
+            
+            # Copia os elementos restantes de cada trecho (se houver)
+            while i < meio:
+                destino[k] = origem[i]
+                i += 1
+                k += 1
+            
+            while j < fim:
+                destino[k] = origem[j]
+                j += 1
+                k += 1
+        
+        # Troca os papéis das listas para a próxima passada
+        origem, destino = destino, origem
+        largura *= 2
+    
+    # Se a última passada terminou no buffer, copia o resultado de volta
+    if origem is not dados:
+        dados[:] = origem
+
+
+# Contagens já calculadas por contar_fatias_merge_sort, indexadas por n
+_cache_fatias = {}
+
+
+def contar_fatias_merge_sort(n):
+    """
+    Retorna (listas, elementos): quantas listas temporárias merge_sort()
+    cria com dados[:meio] e dados[meio:] para ordenar n elementos, e
+    quantos elementos são copiados para elas no total (cerca de n log2 n).
+    """
+    if n <= 1:
+        return 0, 0
+    if n not in _cache_fatias:
+        meio = n // 2
+        listas_esquerda, elementos_esquerda = contar_fatias_merge_sort(meio)
+        listas_direita, elementos_direita = contar_fatias_merge_sort(n - meio)
+        _cache_fatias[n] = (2 + listas_esquerda + listas_direita,
+                            n + elementos_esquerda + elementos_direita)
+    return _cache_fatias[n]
+
+
+def contar_buffer_bottom_up(n):
+    """
+    Retorna (listas, elementos) para merge_sort_bottom_up() com n
+    elementos: o único buffer auxiliar de n posições e, se o número de
+    passadas for ímpar (resultado final no buffer), mais n elementos
+    copiados de volta para a lista original.
+    """
+    if n <= 1:
+        return 0, 0
+    
+    # Mesmas passadas de merge_sort_bottom_up: larguras 1, 2, 4, ... < n
+    passadas = 0
+    largura = 1
+    while largura < n:
+        passadas += 1
+        largura *= 2
+    
+    copiados_de_volta = n if passadas % 2 == 1 else 0
+    return 1, n + copiados_de_volta
+
+
+# Quantidade de vitórias seguidas de uma das sequências que ativa o modo galope
+MIN_GALLOP = 7
+
+
+def _calcular_minrun(n):
+    """
+    Tamanho mínimo dos runs (entre 32 e 64) escolhido de forma que n / minrun
+    seja uma potência de 2 ou um pouco menos: as intercalações ficam equilibradas.
+    """
+    resto = 0
+    while n >= 64:
+        resto |= n & 1
+        n >>= 1
+    return n + resto
+
+
+def _contar_run(dados, inicio, fim):
+    """
+    Encontra o run que começa em inicio: uma sequência crescente
+    (dados[i] <= dados[i + 1]) ou estritamente decrescente. Runs
+    decrescentes são invertidos no lugar; exigir a ordem estrita garante
+    que a inversão não troque a ordem de elementos iguais.
+    Retorna a posição onde o run termina.
+    """
+    j = inicio + 1
+    if j == fim:
+        return fim
+    
+    if dados[j] < dados[inicio]:
+        while j + 1 < fim and dados[j + 1] < dados[j]:
+            j += 1
+        j += 1
+        
+        # Inverte o run decrescente trocando as pontas
+        esquerda = inicio
+        direita = j - 1
+        while esquerda < direita:
+            dados[esquerda], dados[direita] = dados[direita], dados[esquerda]
+            esquerda += 1
+            direita -= 1
+    else:
+        while j + 1 < fim and not dados[j + 1] < dados[j]:
+            j += 1
+        j += 1
+    
+    return j
+
+
+def _insercao_binaria(dados, inicio, fim, ordenados):
+    """
+    Ordena dados[inicio:fim] sabendo que dados[inicio:ordenados] já está
+    ordenado. A posição de cada novo elemento é achada com busca binária
+    (depois dos iguais, para manter a estabilidade).
+    """
+    for i in range(ordenados, fim):
+        pivo = dados[i]
+        esquerda = inicio
+        direita = i
+        
+        while esquerda < direita:
+            meio = (esquerda + direita) // 2
+            if pivo < dados[meio]:
+                direita = meio
+            else:
+                esquerda = meio + 1
+        
+        # Desloca os maiores uma posição para a direita
+        for k in range(i, esquerda, -1):
+            dados[k] = dados[k - 1]
+        dados[esquerda] = pivo
+
+
+def _galopar(dados, chave, inicio, fim, depois_dos_iguais):
+    """
+    Busca galopante em dados[inicio:fim] (ordenado): passos 1, 2, 4, ...
+    a partir de inicio e depois busca binária no último intervalo.
+    Retorna a primeira posição com elemento > chave (depois_dos_iguais)
+    ou >= chave (caso contrário), ou fim se não houver.
+    """
+    limite = inicio
+    passo = 1
+    
+    while limite < fim and (not chave < dados[limite] if depois_dos_iguais
+                            else dados[limite] < chave):
+        inicio = limite + 1
+        limite += passo
+        passo *= 2
+    limite = min(limite, fim)
+    
+    while inicio < limite:
+        meio = (inicio + limite) // 2
+        if not chave < dados[meio] if depois_dos_iguais else dados[meio] < chave:
+            inicio = meio + 1
+        else:
+            limite = meio
+    
+    return inicio
+
+
+def _intercalar_runs(dados, inicio, meio, fim, estado):
+    """
+    Intercala os runs vizinhos dados[inicio:meio] e dados[meio:fim].
+    
+    Antes de intercalar, descarta o começo do run esquerdo e o final do
+    direito, que já estão no lugar. Durante a intercalação, se uma das
+    sequências vence estado["min_gallop"] comparações seguidas, passa ao
+    modo galope: copia de uma vez o bloco inteiro que vem antes do próximo
+    elemento da outra sequência. O limite diminui enquanto o galope
+    compensa e aumenta quando deixa de compensar.
+    """
+    inicio = _galopar(dados, dados[meio], inicio, meio, True)
+    if inicio == meio:
+        return
+    fim = _galopar(dados, dados[meio - 1], meio, fim, False)
+    
+    esquerda = dados[inicio:meio]  # Única cópia: o run esquerdo
+    tamanho = len(esquerda)
+    i = 0     # Índice em esquerda
+    j = meio  # Índice no run direito
+    k = inicio  # Posição de destino
+    min_gallop = estado["min_gallop"]
+    
+    while i < tamanho and j < fim:
+        # Modo normal: um elemento por vez, contando as vitórias seguidas
+        vitorias_esquerda = vitorias_direita = 0
+        while i < tamanho and j < fim and max(vitorias_esquerda, vitorias_direita) < min_gallop:
+            if dados[j] < esquerda[i]:
+                dados[k] = dados[j]
+                j += 1
+                vitorias_direita += 1
+                vitorias_esquerda = 0
+            else:
+                dados[k] = esquerda[i]
+                i += 1
+                vitorias_esquerda += 1
+                vitorias_direita = 0
+            k += 1
+        
+        # Modo galope: copia blocos enquanto eles forem grandes
+        while i < tamanho and j < fim:
+            q = _galopar(esquerda, dados[j], i, tamanho, True)
+            bloco_esquerda = q - i
+            dados[k:k + bloco_esquerda] = esquerda[i:q]
+            k += bloco_esquerda
+            i = q
+            if i == tamanho:
+                break
+            
+            q = _galopar(dados, esquerda[i], j, fim, False)
+            bloco_direita = q - j
+            dados[k:k + bloco_direita] = dados[j:q]
+            k += bloco_direita
+            j = q
+            if j == fim:
+                break
+            
+            min_gallop = max(min_gallop - 1, 1)
+            if bloco_esquerda < MIN_GALLOP and bloco_direita < MIN_GALLOP:
+                min_gallop += 2
+                break
+    
+    # O que sobrou do run direito já está no lugar; copia o resto do esquerdo
+    dados[k:k + tamanho - i] = esquerda[i:]
+    estado["min_gallop"] = min_gallop
+
+
+def merge_sort_natural(dados):
+    """
+    Merge Sort adaptativo, no estilo do Timsort (o algoritmo do sorted()
+    do Python). Aproveita os trechos já ordenados ("runs") da entrada:
+    
+    1. percorre a lista identificando runs crescentes ou estritamente
+       decrescentes (estes são invertidos);
+    2. runs menores que minrun (32 a 64) são completados com inserção
+       binária;
+    3. cada run vai para uma pilha; sempre que os tamanhos do topo deixam
+       de crescer como Fibonacci (A > B + C e B > C), os runs vizinhos são
+       intercalados, o que mantém as intercalações equilibradas;
+    4. as intercalações usam galope quando um run vence muitas vezes seguidas.
+    
+    Uma lista já ordenada, ou formada por poucos blocos ordenados, é
+    ordenada em tempo quase O(n). A ordenação é estável.
+    """
+    n = len(dados)
+    if n < 2:
+        return
+    
+    minrun = _calcular_minrun(n)
+    pilha = []  # Runs pendentes: [inicio, tamanho]
+    estado = {"min_gallop": MIN_GALLOP}
+
+    def intercalar_na_pilha(i):
+        """Intercala os runs i e i + 1 da pilha."""
+        inicio, tamanho = pilha[i]
+        tamanho_seguinte = pilha[i + 1][1]
+        _intercalar_runs(dados, inicio, inicio + tamanho,
+                         inicio + tamanho + tamanho_seguinte, estado)
+        pilha[i] = [inicio, tamanho + tamanho_seguinte]
+        del pilha[i + 1]
+    
+    inicio = 0
+    while inicio < n:
+        fim = _contar_run(dados, inicio, n)
+        
+        # Completa runs curtos até minrun elementos
+        if fim - inicio < minrun:
+            forcado = min(inicio + minrun, n)
+            _insercao_binaria(dados, inicio, forcado, fim)
+            fim = forcado
+        
+        pilha.append([inicio, fim - inicio])
+        inicio = fim
+        
+        # Restaura as invariantes da pilha (mesma regra do CPython)
+        while len(pilha) > 1:
+            i = len(pilha) - 2
+            if ((i > 0 and pilha[i - 1][1] <= pilha[i][1] + pilha[i + 1][1])
+                    or (i > 1 and pilha[i - 2][1] <= pilha[i - 1][1] + pilha[i][1])):
+                if pilha[i - 1][1] < pilha[i + 1][1]:
+                    i -= 1
+            elif pilha[i][1] > pilha[i + 1][1]:
+                break
+            intercalar_na_pilha(i)
+    
+    # Intercala o que restou na pilha
+    while len(pilha) > 1:
+        i = len(pilha) - 2
+        if i > 0 and pilha[i - 1][1] < pilha[i + 1][1]:
+            i -= 1
+        intercalar_na_pilha(i)
+
+
+def comparar_bottom_up(tamanho=200000, repeticoes=3):
+    """
+    Compara merge_sort() com merge_sort_bottom_up(): listas temporárias
+    criadas e elementos copiados para elas (calculados por
+    contar_fatias_merge_sort e contar_buffer_bottom_up), pico de memória
+    medido com tracemalloc e tempo médio.
+    """
+    import random
+    import time
+    import tracemalloc
+    
+    original = [random.randint(0, tamanho) for _ in range(tamanho)]
+    alocacoes = {
+        "recursivo": contar_fatias_merge_sort(tamanho),
+        "bottom-up": contar_buffer_bottom_up(tamanho),
+    }
+    
+    for nome, funcao in (("recursivo", merge_sort), ("bottom-up", merge_sort_bottom_up)):
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            copia = original[:]
+            funcao(copia)
+        tempo_medio = (time.perf_counter() - inicio) / repeticoes
+        assert copia == sorted(original)
+        
+        copia = original[:]
+        tracemalloc.start()
+        funcao(copia)
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        
+        listas, elementos = alocacoes[nome]
+        print(f"{nome:>10}: {tempo_medio * 1000:9.2f} ms, {listas:>8} listas temporárias "
+              f"({elementos:>9} elementos), pico {pico / 1024:8.1f} KiB")
+
+
+def comparar_recursivo_pilha(tamanho=20000, repeticoes=5):
+    """
+    Compara merge_sort() com merge_sort_pilha(): tempo médio e pico de
+    memória alocada para ordenar a mesma lista aleatória.
+    """
+    import random
+    import time
+    import tracemalloc
+    
+    original = [random.randint(0, tamanho) for _ in range(tamanho)]
+    
+    for nome, funcao in (("recursivo", merge_sort), ("pilha", merge_sort_pilha)):
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            funcao(original[:])
+        tempo_medio = (time.perf_counter() - inicio) / repeticoes
+        
+        copia = original[:]
+        tracemalloc.start()
+        funcao(copia)
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        
+        print(f"{nome:>10}: {tempo_medio * 1000:8.2f} ms, pico {pico / 1024:8.1f} KiB")
+
+
+def comparar_natural(tamanho=100000):
+    """
+    Compara merge_sort() com merge_sort_natural() em entradas com
+    diferentes graus de ordenação: tempo e número de comparações.
+    """
+    import random
+    import time
+
+    class Contador:
+        """Número que conta as comparações feitas com o operador <."""
+        comparacoes = 0
+
+        def __init__(self, valor):
+            self.valor = valor
+
+        def __lt__(self, outro):
+            Contador.comparacoes += 1
+            return self.valor < outro.valor
+    
+    aleatoria = random.sample(range(tamanho * 10), tamanho)
+    lotes = []
+    for _ in range(10):
+        lotes.extend(sorted(random.randint(0, tamanho) for _ in range(tamanho // 10)))
+    quase = sorted(aleatoria)
+    for _ in range(tamanho // 1000):
+        a = random.randrange(tamanho)
+        b = random.randrange(tamanho)
+        quase[a], quase[b] = quase[b], quase[a]
+    
+    entradas = {
+        "aleatória": aleatoria,
+        "ordenada": sorted(aleatoria),
+        "invertida": sorted(aleatoria, reverse=True),
+        "10 lotes ordenados": lotes,
+        "quase ordenada": quase,
+    }
+    
+    for nome_entrada, original in entradas.items():
+        print(f"{nome_entrada}:")
+        for nome, funcao in (("merge_sort", merge_sort), ("natural", merge_sort_natural)):
+            copia = original[:]
+            inicio = time.perf_counter()
+            funcao(copia)
+            tempo = time.perf_counter() - inicio
+            assert copia == sorted(original)
+            
+            copia = [Contador(valor) for valor in original]
+            Contador.comparacoes = 0
+            funcao(copia)
+            print(f"  {nome:>10}: {tempo * 1000:8.2f} ms, {Contador.comparacoes:>9} comparações")
+
+
 def main():
     """
     Função principal que demonstra o uso do algoritmo Merge Sort.
@@ -53,6 +555,30 @@ def main():
     
     print(f"Lista ordenada: {dados}")
 
+    # Mesma ordenação usando uma pilha explícita
+    dados = [38, 27, 82, 15, 63, 41, 56, 74]
+    merge_sort_pilha(dados)
+    print(f"Com pilha:      {dados}")
+    
+    # Mesma ordenação de baixo para cima, com um único buffer auxiliar
+    dados = [38, 27, 82, 15, 63, 41, 56, 74]
+    merge_sort_bottom_up(dados)
+    print(f"Bottom-up:      {dados}")
+    
+    # Versão adaptativa, que aproveita trechos já ordenados
+    dados = [38, 27, 82, 15, 63, 41, 56, 74]
+    merge_sort_natural(dados)
+    print(f"Natural:        {dados}")
+    
+    print("\n=== Recursão x Pilha explícita (20000 elementos) ===\n")
+    comparar_recursivo_pilha()
+    
+    print("\n=== Recursivo x Bottom-up (200000 elementos) ===\n")
+    comparar_bottom_up()
+
+    print("\n=== Merge Sort x Natural (100000 elementos) ===\n")
+    comparar_natural()
+
 # Ponto de entrada do programa
 if __name__ == "__main__":
     main()
\ No newline at end of file
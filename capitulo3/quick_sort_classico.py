@@ -68,6 +68,162 @@ def particionar(dados, inicio, fim):
     return indice_direita
 
 
+# Trechos com até este tamanho são ordenados por inserção no introSort
+LIMITE_INSERCAO = 16
+
+
+def introSort(dados, inicio, fim):
+    """
+    Introsort: Quick Sort com proteções contra o pior caso.
+    
+    - O pivô é a mediana de três elementos (início, meio e fim) ou, em
+      trechos grandes, a "mediana das medianas" de nove (ninther). Ele é
+      levado para dados[inicio] e a partição é feita por particionar().
+    - Trechos com até LIMITE_INSERCAO elementos são ordenados por inserção,
+      que é mais rápida em listas pequenas.
+    - Se a profundidade passar de 2·log2(n), o trecho é ordenado com
+      Heap Sort, garantindo O(n log n) mesmo para entradas ruins.
+    - Só a parte menor da partição é ordenada por recursão; a maior é
+      tratada no próprio laço. Assim a pilha tem no máximo log2(n) níveis.
+    
+    Parâmetros:
+        dados: lista a ser ordenada
+        inicio: índice inicial do segmento a ordenar
+        fim: índice final do segmento a ordenar
+    """
+    if inicio < fim:
+        profundidade_maxima = 2 * (fim - inicio + 1).bit_length()
+        _introsort(dados, inicio, fim, profundidade_maxima)
+
+
+def _introsort(dados, inicio, fim, profundidade):
+    """Laço principal do introSort sobre dados[inicio..fim]."""
+    while fim - inicio + 1 > LIMITE_INSERCAO:
+        # Partições ruins demais: Heap Sort no trecho restante
+        if profundidade == 0:
+            _heap_sort(dados, inicio, fim)
+            return
+        profundidade -= 1
+        
+        # Leva o pivô escolhido para o início e reaproveita particionar()
+        indice_pivo = _escolher_pivo(dados, inicio, fim)
+        dados[inicio], dados[indice_pivo] = dados[indice_pivo], dados[inicio]
+        indice_pivo = particionar(dados, inicio, fim)
+        
+        # Recursão só na parte menor; a maior continua no laço
+        if indice_pivo - inicio < fim - indice_pivo:
+            _introsort(dados, inicio, indice_pivo - 1, profundidade)
+            inicio = indice_pivo + 1
+        else:
+            _introsort(dados, indice_pivo + 1, fim, profundidade)
+            fim = indice_pivo - 1
+    
+    _insercao(dados, inicio, fim)
+
+
+def _mediana_de_tres(dados, a, b, c):
+    """Retorna o índice (a, b ou c) que contém a mediana dos três elementos."""
+    if dados[a] < dados[b]:
+        if dados[b] < dados[c]:
+            return b
+        return c if dados[a] < dados[c] else a
+    if dados[a] < dados[c]:
+        return a
+    return c if dados[b] < dados[c] else b
+
+
+def _escolher_pivo(dados, inicio, fim):
+    """
+    Mediana de três para trechos pequenos; para trechos com 40 elementos
+    ou mais, mediana de três medianas de três (ninther de Tukey).
+    """
+    meio = (inicio + fim) // 2
+    if fim - inicio + 1 < 40:
+        return _mediana_de_tres(dados, inicio, meio, fim)
+    
+    passo = (fim - inicio + 1) // 8
+    return _mediana_de_tres(
+        dados,
+        _mediana_de_tres(dados, inicio, inicio + passo, inicio + 2 * passo),
+        _mediana_de_tres(dados, meio - passo, meio, meio + passo),
+        _mediana_de_tres(dados, fim - 2 * passo, fim - passo, fim),
+    )
+
+
+def _insercao(dados, inicio, fim):
+    """Ordena dados[inicio..fim] por inserção."""
+    for i in range(inicio + 1, fim + 1):
+        atual = dados[i]
+        j = i - 1
+        while j >= inicio and atual < dados[j]:
+            dados[j + 1] = dados[j]
+            j -= 1
+        dados[j + 1] = atual
+
+
+def _heap_sort(dados, inicio, fim):
+    """Ordena dados[inicio..fim] com Heap Sort (heap máximo no próprio trecho)."""
+    tamanho = fim - inicio + 1
+    
+    # Constrói o heap a partir do último nodo com filhos
+    for raiz in range(tamanho // 2 - 1, -1, -1):
+        _descer(dados, inicio, raiz, tamanho)
+    
+    # Move o maior para o final e reconstrói o heap no restante
+    for ultimo in range(tamanho - 1, 0, -1):
+        dados[inicio], dados[inicio + ultimo] = dados[inicio + ultimo], dados[inicio]
+        _descer(dados, inicio, 0, ultimo)
+
+
+def _descer(dados, inicio, raiz, tamanho):
+    """Desce o nodo raiz no heap dados[inicio..inicio+tamanho-1] até sua posição."""
+    while True:
+        maior = raiz
+        esquerda = 2 * raiz + 1
+        direita = esquerda + 1
+        
+        if esquerda < tamanho and dados[inicio + maior] < dados[inicio + esquerda]:
+            maior = esquerda
+        if direita < tamanho and dados[inicio + maior] < dados[inicio + direita]:
+            maior = direita
+        if maior == raiz:
+            return
+        
+        dados[inicio + raiz], dados[inicio + maior] = dados[inicio + maior], dados[inicio + raiz]
+        raiz = maior
+
+
+def comparar_introsort(tamanho=20000):
+    """
+    Compara quickSort() com introSort() em entradas aleatórias, já
+    ordenadas, invertidas e com todos os valores iguais.
+    """
+    import random
+    import time
+    
+    aleatoria = [random.randint(0, tamanho) for _ in range(tamanho)]
+    entradas = {
+        "aleatória": aleatoria,
+        "ordenada": sorted(aleatoria),
+        "invertida": sorted(aleatoria, reverse=True),
+        "valores iguais": [7] * tamanho,
+    }
+    
+    for nome_entrada, original in entradas.items():
+        print(f"{nome_entrada}:")
+        for nome, funcao in (("quickSort", quickSort), ("introSort", introSort)):
+            copia = original[:]
+            inicio = time.perf_counter()
+            try:
+                funcao(copia, 0, len(copia) - 1)
+            except RecursionError:
+                print(f"  {nome:>10}: estouro do limite de recursão")
+                continue
+            tempo = time.perf_counter() - inicio
+            assert copia == sorted(original)
+            print(f"  {nome:>10}: {tempo * 1000:8.2f} ms")
+
+
 def main():
     """
     Função principal que demonstra o uso do Quick Sort.
@@ -83,6 +239,15 @@ def main():
     
     print("\nLista ordenada:")
     print(dados)
+    
+    # Mesma ordenação com o introSort
+    dados = [42, 78, 24, 63, 27, 9, 34, 51, 21]
+    introSort(dados, 0, len(dados) - 1)
+    print("\nCom introSort:")
+    print(dados)
+    
+    print("\n=== quickSort x introSort (20000 elementos) ===\n")
+    comparar_introsort()
 
 
 # Ponto de entrada do programa
@@ -228,6 +228,23 @@ class AVLTree:
         else:
             return self.buscar(dado, nodo.right)
 
+    def buscar_iterativo(self, dado):
+        """
+        Busca um dado na árvore sem recursão.
+        Retorna o mesmo resultado que buscar().
+        """
+        nodo = self.root
+        
+        while nodo is not None:
+            if dado == nodo.dado:
+                return True
+            elif dado < nodo.dado:
+                nodo = nodo.left
+            else:
+                nodo = nodo.right
+        
+        return False
+
     # ==================== PERCURSOS EM PROFUNDIDADE ====================
 
     def em_ordem(self, nodo="inicio"):
@@ -417,6 +434,7 @@ def exibir_menu():
     print("12 - Demonstrar rotacoes (exemplo didatico)")
     print("13 - Reiniciar arvore (limpar)")
     print("14 - Limpar tela")
+    print("15 - Comparar busca recursiva e iterativa")
     print("0  - Sair")
     print("=" * 60)
 
@@ -647,6 +665,39 @@ def demonstrar_rotacoes():
     print("=" * 60)
 
 
+def comparar_recursivo_iterativo(quantidade=10000, repeticoes=5):
+    """
+    Compara buscar() (recursivo) com buscar_iterativo() procurando
+    todas as chaves de uma árvore AVL. Mostra o tempo médio por busca
+    e o pico de memória de cada versão.
+    """
+    import time
+    import tracemalloc
+    
+    arvore = AVLTree()
+    for valor in range(quantidade):
+        arvore.inserir(valor)
+
+    def buscar_todos(funcao):
+        for valor in range(quantidade):
+            funcao(valor)
+    
+    print(f"\nArvore AVL com {quantidade} chaves (altura {arvore.obter_altura_arvore()}):")
+    for nome, funcao in (("buscar (recursivo)", arvore.buscar),
+                         ("buscar (iterativo)", arvore.buscar_iterativo)):
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            buscar_todos(funcao)
+        tempo_medio = (time.perf_counter() - inicio) / (repeticoes * quantidade)
+        
+        tracemalloc.start()
+        buscar_todos(funcao)
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        
+        print(f"  {nome:<20} {tempo_medio * 1e6:8.2f} µs/busca  pico {pico / 1024:8.1f} KiB")
+
+
 def reiniciar_arvore(arvore):
     """Reinicia a árvore, removendo todos os elementos."""
     confirmacao = input("\nTem certeza que deseja limpar a arvore? (s/n): ")
@@ -711,12 +762,15 @@ if __name__ == "__main__":
             elif opcao == "14":
                 limpar_tela()
             
+            elif opcao == "15":
+                comparar_recursivo_iterativo()
+            
             elif opcao == "0":
                 print("\nObrigado por usar o sistema! Ate logo!\n")
                 break
             
             else:
-                print("\nOpcao invalida! Escolha um numero de 0 a 14.")
+                print("\nOpcao invalida! Escolha um numero de 0 a 15.")
         
         except KeyboardInterrupt:
             print("\n\nPrograma interrompido. Ate logo!\n")
@@ -41,6 +41,34 @@ class BinarySearchTree:
                     # Não existe filho? Insere aqui
                     nodo_atual.right = Node(dado)
 
+    def inserir_iterativo(self, dado):
+        """
+        Insere um novo dado na árvore sem recursão.
+        Produz exatamente a mesma árvore que inserir(), mas não depende
+        do limite de recursão (útil em árvores degeneradas).
+        """
+        # Árvore vazia? O novo dado se torna a raiz
+        if self.root is None:
+            self.root = Node(dado)
+            return
+        
+        # Desce pela árvore até encontrar uma posição livre
+        nodo_atual = self.root
+        while True:
+            # Dado menor? Vai para a esquerda
+            if dado < nodo_atual.dado:
+                if nodo_atual.left is None:
+                    nodo_atual.left = Node(dado)
+                    return
+                nodo_atual = nodo_atual.left
+            
+            # Dado maior ou igual? Vai para a direita
+            else:
+                if nodo_atual.right is None:
+                    nodo_atual.right = Node(dado)
+                    return
+                nodo_atual = nodo_atual.right
+
     # ==================== PERCURSOS EM PROFUNDIDADE ====================
 
     def em_ordem(self, nodo="inicio"):
@@ -60,6 +88,28 @@ class BinarySearchTree:
         resultado += self.em_ordem(nodo.right)  # Visita subárvore direita
         return resultado
 
+    def em_ordem_iterativo(self):
+        """
+        Percurso em ordem usando uma pilha explícita no lugar da recursão.
+        Retorna a mesma lista que em_ordem().
+        """
+        resultado = []
+        pilha = []
+        nodo = self.root
+        
+        while pilha or nodo is not None:
+            # Desce o máximo possível pela esquerda, empilhando os nodos
+            while nodo is not None:
+                pilha.append(nodo)
+                nodo = nodo.left
+            
+            # Visita o nodo do topo e segue para a subárvore direita
+            nodo = pilha.pop()
+            resultado.append(nodo.dado)
+            nodo = nodo.right
+        
+        return resultado
+
     def pre_ordem(self, nodo="inicio"):
         """
         Percurso pré-ordem (pre-order): raiz -> esquerda -> direita
@@ -145,6 +195,50 @@ class BinarySearchTree:
         return self.root is None
 
 
+def comparar_recursivo_iterativo(quantidade=800, repeticoes=20):
+    """
+    Compara as versões recursivas e iterativas de inserção e percurso
+    em ordem numa árvore degenerada (chaves inseridas já ordenadas).
+    Mostra o tempo médio e o pico de memória de cada versão.
+    """
+    import time
+    import tracemalloc
+
+    def construir_recursivo():
+        arvore = BinarySearchTree()
+        for valor in range(quantidade):
+            arvore.inserir(valor)
+        return arvore
+
+    def construir_iterativo():
+        arvore = BinarySearchTree()
+        for valor in range(quantidade):
+            arvore.inserir_iterativo(valor)
+        return arvore
+    
+    arvore = construir_iterativo()
+    casos = [
+        ("inserir (recursivo)", construir_recursivo),
+        ("inserir (iterativo)", construir_iterativo),
+        ("em_ordem (recursivo)", arvore.em_ordem),
+        ("em_ordem (iterativo)", arvore.em_ordem_iterativo),
+    ]
+    
+    print(f"\nArvore degenerada com {quantidade} chaves:")
+    for nome, funcao in casos:
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            funcao()
+        tempo_medio = (time.perf_counter() - inicio) / repeticoes
+        
+        tracemalloc.start()
+        funcao()
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        
+        print(f"  {nome:<22} {tempo_medio * 1000:9.2f} ms  pico {pico / 1024:9.1f} KiB")
+
+
 def limpar_tela():
     """Função auxiliar para limpar a tela."""
     import os
@@ -164,6 +258,7 @@ def exibir_menu():
     print("6 - Mostrar todos os percursos")
     print("7 - Reiniciar arvore (limpar)")
     print("8 - Limpar tela")
+    print("9 - Comparar versoes recursiva e iterativa")
     print("0 - Sair")
     print("=" * 60)
 
@@ -279,12 +374,15 @@ if __name__ == "__main__":
             elif opcao == "8":
                 limpar_tela()
             
+            elif opcao == "9":
+                comparar_recursivo_iterativo()
+            
             elif opcao == "0":
                 print("\nObrigado por usar o sistema! Ate logo!\n")
                 break
             
             else:
-                print("\nOpcao invalida! Escolha um numero de 0 a 8.")
+                print("\nOpcao invalida! Escolha um numero de 0 a 9.")
         
         except KeyboardInterrupt:
             print("\n\nPrograma interrompido. Ate logo!\n")